@@ -1,7 +1,7 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_all
 
-datas = [('sofa_icon.png', '.'), ('src/sofa_jobs_navigator/ui/assets/help/*.png', 'sofa_jobs_navigator/ui/assets/help'), ('src/sofa_jobs_navigator/ui/assets/help/README.md', 'sofa_jobs_navigator/ui/assets/help')]
+datas = [('sofa_icon.png', '.'), ('src/sofa_jobs_navigator/ui/assets/help/*.png', 'sofa_jobs_navigator/ui/assets/help'), ('src/sofa_jobs_navigator/ui/assets/help/README.md', 'sofa_jobs_navigator/ui/assets/help'), ('src/sofa_jobs_navigator/ui/assets/sofa_icon_macos.png', 'sofa_jobs_navigator/ui/assets')]
 binaries = []
 hiddenimports = []
 tmp_ret = collect_all('googleapiclient')
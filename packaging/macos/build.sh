@@ -53,6 +53,7 @@ pyinstaller \
   ${ICON_PNG:+--add-data "$ICON_PNG:."} \
   --add-data "$HELP_DIR/*.png:sofa_jobs_navigator/ui/assets/help" \
   --add-data "$HELP_DIR/README.md:sofa_jobs_navigator/ui/assets/help" \
+  --add-data "src/sofa_jobs_navigator/ui/assets/sofa_icon_macos.png:sofa_jobs_navigator/ui/assets" \
   --collect-all googleapiclient \
   --collect-all google_auth_oauthlib \
   "run.py"
@@ -13,7 +13,7 @@ from .config.flags import FLAGS
 from .version import app_display_title
 from .config.settings import Settings, SettingsManager
 from .controls.hotkeys import HotkeyManager
-from .logging.event_log import LOGGER, LOG_APP_NAME, LOG_FILE_NAME
+from .logging.event_log import LOGGER
 from .logging.console_file import CONSOLE_FILE_LOGGER
 from .services.auth_service import AuthService
 from .services.drive_client import DriveClient
@@ -27,7 +27,6 @@ from .utils.app_icons import set_app_icon
 from .utils.clipboard import ClipboardReader
 from .utils.sku import DEFAULT_DETECTOR
 from .utils.sound import SoundPlayer
-from platformdirs import user_log_path
 
 
 # =================== APPLICATION BOOT ===================
@@ -120,7 +119,7 @@ def run() -> None:
             email = auth_service.get_account_email(creds) or getattr(creds, 'service_account_email', None) or getattr(creds, 'client_id', None)
             update_account_label(email)
             # Enable online Drive service immediately
-            drive_client._service_factory = lambda: GoogleDriveService(creds)  # type: ignore[attr-defined]
+            drive_client.set_service_factory(lambda: GoogleDriveService(creds))
             main_window.console_success('Connected to Google Drive.')
             try:
                 expiry = auth_service.get_token_expiry_iso(creds)
@@ -191,9 +190,9 @@ def run() -> None:
         text = clipboard.read_text()
         # Detect all SKUs in clipboard for potential multi-SKU handling later
         try:
-            all_results = DEFAULT_DETECTOR.find_all(text or '')
+            all_skus = DEFAULT_DETECTOR.find_all_skus(text or '')
         except Exception:
-            all_results = []
+            all_skus = []
         if not FLAGS.offline_mode:
             try:
                 creds = auth_service.ensure_authenticated()
@@ -201,7 +200,7 @@ def run() -> None:
                 email = auth_service.get_account_email(creds) or getattr(creds, 'service_account_email', None) or getattr(creds, 'client_id', None)
                 update_account_label(email)
                 # Inject online Drive service for real lookups via factory
-                drive_client._service_factory = lambda: GoogleDriveService(creds)  # type: ignore[attr-defined]
+                drive_client.set_service_factory(lambda: GoogleDriveService(creds))
                 try:
                     expiry = auth_service.get_token_expiry_iso(creds)
                     main_window.set_status(online=True, account=email, token_expiry_iso=expiry)
@@ -220,8 +219,8 @@ def run() -> None:
             return
         # Offer to load additional SKUs (excluding the first already processed) if multiple were present
         try:
-            if all_results and len(all_results) > 1:
-                _offer_load_multi_skus(all_results, first_processed=sku_result.sku)
+            if all_skus and len(all_skus) > 1:
+                _offer_load_multi_skus(all_skus, first_processed=sku_result.sku)
         except Exception:
             pass
 
@@ -415,7 +414,7 @@ def run() -> None:
                 # Offer to load multiple SKUs into recents (no auto-search here)
                 if len(results) > 1:
                     try:
-                        _offer_load_multi_skus(results, first_processed=None)
+                        _offer_load_multi_skus([r.sku for r in results], first_processed=None)
                     except Exception:
                         pass
         except Exception:
@@ -515,8 +514,8 @@ def run() -> None:
             pass
         # Clear event log
         try:
-            log_dir = user_log_path(LOG_APP_NAME)
-            (log_dir / LOG_FILE_NAME).write_text('', encoding='utf-8')
+            # Through the logger, so batched records are not written back afterwards
+            LOGGER.clear()
         except Exception:
             pass
         # Clear auth tokens and set offline status
@@ -631,7 +630,7 @@ def run() -> None:
             creds = auth_service.ensure_authenticated()
             email = auth_service.get_account_email(creds) or getattr(creds, 'service_account_email', None) or getattr(creds, 'client_id', None)
             update_account_label(email)
-            drive_client._service_factory = lambda: GoogleDriveService(creds)  # type: ignore[attr-defined]
+            drive_client.set_service_factory(lambda: GoogleDriveService(creds))
             main_window.console_success('Auto-connected to Google Drive')
             try:
                 expiry = auth_service.get_token_expiry_iso(creds)
@@ -681,17 +680,17 @@ def run() -> None:
         except Exception:
             txt = ''
         try:
-            results = DEFAULT_DETECTOR.find_all(txt or '')
+            skus = DEFAULT_DETECTOR.find_all_skus(txt or '')
         except Exception:
-            results = []
-        if not results:
+            skus = []
+        if not skus:
             try:
                 main_window.console_warning('No SKU found in clipboard after connect.')
             except Exception:
                 pass
             return
         # If at least one, optionally auto-run search with first SKU
-        first = results[0].sku
+        first = skus[0]
         try:
             root.clipboard_clear()
             root.clipboard_append(first)
@@ -707,19 +706,19 @@ def run() -> None:
         except Exception:
             pass
         try:
-            if len(results) > 1:
-                _offer_load_multi_skus(results, first_processed=first)
+            if len(skus) > 1:
+                _offer_load_multi_skus(skus, first_processed=first)
         except Exception:
             pass
 
-    def _offer_load_multi_skus(results, first_processed: str | None) -> None:
+    def _offer_load_multi_skus(found_skus: list[str], first_processed: str | None) -> None:
         """Ask user whether to load additional SKUs into Recents.
 
-        results: list of detector results (objects with .sku)
+        found_skus: SKU strings in detection order (duplicates allowed)
         first_processed: SKU already processed (exclude from addition) or None
         """
         try:
-            if not results or len(results) <= 1:
+            if not found_skus or len(found_skus) <= 1:
                 return
             # Determine if prompt should be skipped
             try:
@@ -727,7 +726,6 @@ def run() -> None:
             except Exception:
                 skip_prompt = False
             # Build unique list (preserving order) before prompting so we can display it
-            found_skus = [r.sku for r in results]
             seen = set()
             unique: list[str] = []
             for s in found_skus:
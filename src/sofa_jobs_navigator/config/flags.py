@@ -8,13 +8,14 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from typing import ClassVar
 
 # =================== FLAG DEFINITIONS ===================
 # Each flag pulls from an environment variable first, then falls back to a default.
 # Update the defaults conservatively so production builds stay quiet by default.
 # --------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlagSet:
     """Structured view of all debug/test flags."""
 
@@ -26,6 +27,9 @@ class FlagSet:
     mock_clipboard: str | None
     test_hotkey: str | None
 
+    # All flags off; derive variants with ``dataclasses.replace(FlagSet.DEFAULT, ...)``
+    DEFAULT: ClassVar["FlagSet"]
+
 
 def _env_bool(name: str, default: bool = False) -> bool:
     """Parse an environment variable into a boolean."""
@@ -65,6 +69,16 @@ def load_flags() -> FlagSet:
     )
 
 
+FlagSet.DEFAULT = FlagSet(
+    verbose_logging=False,
+    offline_mode=False,
+    config_dry_run=False,
+    ui_debug=False,
+    mute_sounds=False,
+    mock_clipboard=None,
+    test_hotkey=None,
+)
+
 FLAGS = load_flags()
 
 
@@ -2,28 +2,50 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 from platformdirs import user_config_path
 
+try:
+    # Optional: orjson parses and serializes several times faster than json
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
 from .flags import FlagSet, FLAGS
 from . import reference_data as ref
+from ..logging.event_log import LOGGER
 
 CONFIG_APP_NAME = "sofa_jobs_navigator"
 CONFIG_FILE_NAME = "config.json"
 
 
-@dataclass
+def _dumps(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes) -> dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True, slots=True)
 class Favorite:
     label: str
     path: str
     hotkey: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     favorites: List[Favorite] = field(default_factory=list)
     working_folder: str | None = None
@@ -45,23 +67,94 @@ class Settings:
     session_count: int = 0
 
 
+# Favorites are frozen, so the templates below are shared instead of rebuilt per load
+MIN_FAVORITES = 8
+_EMPTY_FAVORITE = Favorite(label='', path='', hotkey=None)
+
+
+def _build_default_favorites() -> tuple[Favorite, ...]:
+    favorites = [Favorite(label=data['label'], path=data.get('path', ''), hotkey=None) for data in ref.DEFAULT_SHORTCUTS]
+    # Guarantee at least 8 entries even if defaults change
+    favorites.extend([_EMPTY_FAVORITE] * (MIN_FAVORITES - len(favorites)))
+    return tuple(favorites)
+
+
+_DEFAULT_FAVORITES = _build_default_favorites()
+
+
 # =================== SETTINGS MANAGER ===================
 
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename inside *directory* (no-op where directories can't be opened, e.g. Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 class SettingsManager:
     def __init__(self, *, flags: FlagSet = FLAGS, config_dir: Path | None = None) -> None:
         self._flags = flags
         self._config_dir = config_dir or user_config_path(CONFIG_APP_NAME)
         self._config_path = Path(self._config_dir) / CONFIG_FILE_NAME
+        # Parsed config keyed by the file's (mtime_ns, size); repeated loads
+        # of an unchanged file cost one stat() instead of open + parse.
+        self._cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+        # Stat key and digest of the last blob save() wrote, to skip identical rewrites
+        self._written: tuple[tuple[int, int], bytes] | None = None
+
+    def invalidate(self) -> None:
+        """Forget the cached config so the next ``load()`` re-reads the file."""
+        self._cache = None
 
     def load(self) -> Settings:
-        if not self._config_path.exists():
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            self._cache = None
             return self._defaults()
-        with self._config_path.open('r', encoding='utf-8') as fh:
-            raw = json.load(fh)
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is not None and self._cache[0] == key:
+            raw = self._cache[1]
+        else:
+            try:
+                raw = _loads(self._config_path.read_bytes())
+            except ValueError:
+                # Truncated by an older in-place write, or broken by a hand edit.
+                # Keep the original bytes before the next save replaces them with defaults.
+                self._cache = None
+                self._set_aside_unreadable()
+                return self._defaults()
+            self._cache = (key, raw)
+        return self._from_raw(raw)
+
+    def _set_aside_unreadable(self) -> None:
+        """Rename an unparsable config to ``config.json.corrupt-<timestamp>`` and warn."""
+        if self._flags.config_dry_run:
+            # Nothing is saved in dry-run mode, so the file is not at risk
+            return
+        target = self._config_path.with_name(
+            f"{CONFIG_FILE_NAME}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}"
+        )
+        try:
+            os.replace(self._config_path, target)
+        except OSError as exc:
+            LOGGER.warn('Unreadable config could not be moved aside', path=str(self._config_path), error=str(exc))
+            return
+        LOGGER.warn('Unreadable config moved aside; using defaults', path=str(target))
+
+    @staticmethod
+    def _from_raw(raw: dict[str, Any]) -> Settings:
         favorites = [Favorite(**fav) for fav in raw.get('favorites', [])]
         # Ensure a minimum of 8 favorites (pad with empty entries for older configs)
-        while len(favorites) < 8:
-            favorites.append(Favorite(label='', path='', hotkey=None))
+        if len(favorites) < MIN_FAVORITES:
+            favorites.extend([_EMPTY_FAVORITE] * (MIN_FAVORITES - len(favorites)))
         return Settings(
             favorites=favorites,
             working_folder=raw.get('working_folder'),
@@ -72,15 +165,20 @@ class SettingsManager:
             auto_search_clipboard_after_connect=raw.get('auto_search_clipboard_after_connect', True),
             auto_load_multi_skus_without_prompt=raw.get('auto_load_multi_skus_without_prompt', False),
             open_root_on_sku_found=raw.get('open_root_on_sku_found', False),
-            recent_skus=raw.get('recent_skus', []),
+            recent_skus=list(raw.get('recent_skus', [])),
             show_help_on_startup=raw.get('show_help_on_startup', True),
             session_count=int(raw.get('session_count', 0) or 0),
         )
 
-    def save(self, settings: Settings) -> None:
+    def save(self, settings: Settings, *, durable: bool = False) -> None:
+        """Write *settings* atomically via a temp file and ``os.replace``.
+
+        The rename alone guarantees readers never see a half-written file, so
+        no fsync is done by default (a lost write just leaves the previous
+        config). ``durable=True`` also fsyncs the file and its directory.
+        """
         if self._flags.config_dry_run:
             return
-        self._config_dir.mkdir(parents=True, exist_ok=True)
         payload = {
             'favorites': [asdict(fav) for fav in settings.favorites],
             'working_folder': settings.working_folder,
@@ -91,19 +189,37 @@ class SettingsManager:
             'auto_search_clipboard_after_connect': getattr(settings, 'auto_search_clipboard_after_connect', False),
             'auto_load_multi_skus_without_prompt': getattr(settings, 'auto_load_multi_skus_without_prompt', False),
             'open_root_on_sku_found': getattr(settings, 'open_root_on_sku_found', False),
-            'recent_skus': settings.recent_skus,
+            'recent_skus': list(settings.recent_skus),
             'show_help_on_startup': settings.show_help_on_startup,
             'session_count': int(getattr(settings, 'session_count', 0) or 0),
         }
-        with self._config_path.open('w', encoding='utf-8') as fh:
-            json.dump(payload, fh, indent=2)
+        blob = _dumps(payload)
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        if not durable and self._written is not None and self._written[1] == digest:
+            # Same bytes as our last write; skip unless the file changed since
+            try:
+                st = self._config_path.stat()
+            except OSError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == self._written[0]:
+                return
+        self._config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._config_path.with_name(CONFIG_FILE_NAME + '.tmp')
+        with tmp_path.open('wb') as fh:
+            fh.write(blob)
+            if durable:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, self._config_path)
+        if durable:
+            _fsync_dir(Path(self._config_dir))
+        st = self._config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        self._cache = (key, payload)
+        self._written = (key, digest)
 
     def _defaults(self) -> Settings:
-        favorites = [Favorite(label=data['label'], path=data.get('path', ''), hotkey=None) for data in ref.DEFAULT_SHORTCUTS]
-        # Guarantee at least 8 entries even if defaults change
-        while len(favorites) < 8:
-            favorites.append(Favorite(label='', path='', hotkey=None))
-        return Settings(favorites=favorites, recent_skus=[], session_count=0)
+        return Settings(favorites=list(_DEFAULT_FAVORITES), recent_skus=[], session_count=0)
 
 
 # =================== END SETTINGS MANAGER ===================
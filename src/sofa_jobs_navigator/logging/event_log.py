@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from platformdirs import user_log_path
 try:
@@ -20,6 +22,89 @@ LOG_APP_NAME = "sofa_jobs_navigator"
 LOG_FILE_NAME = "events.log"
 
 
+class _BatchedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that writes records in batches.
+
+    The stock handler seeks, writes and flushes the file for every record.
+    Here formatted lines are buffered and written with a single write+flush
+    once ``batch_size`` lines are pending or a WARNING (or worse) arrives.
+    A timer writes whatever is still pending ``max_delay`` seconds after the
+    first buffered line, so the tail of a burst reaches disk while the app is
+    idle. ``flush()`` and ``close()`` (called by ``logging.shutdown`` at exit)
+    drain the buffer.
+    """
+
+    def __init__(self, filename, *, batch_size: int = 64, max_delay: float = 0.5, **kwargs) -> None:
+        super().__init__(filename, **kwargs)
+        self._batch_size = max(1, batch_size)
+        self._max_delay = max_delay
+        self._buf: list[str] = []
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buf.append(self.format(record) + self.terminator)
+            if len(self._buf) >= self._batch_size or record.levelno >= logging.WARNING:
+                self._write_batch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_batch()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        self._cancel_timer()
+        super().close()
+
+    def reset(self) -> None:
+        """Drop pending records and truncate the log file."""
+        self.acquire()
+        try:
+            self._buf.clear()
+            self._cancel_timer()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.truncate(0)
+        finally:
+            self.release()
+
+    def _open(self):
+        # Binary stream: each batch is encoded once with str.encode (in C)
+        # instead of going through a TextIOWrapper, and sizes are exact bytes.
+        return open(self.baseFilename, self.mode.replace("b", "") + "b")
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write_batch(self) -> None:
+        self._cancel_timer()
+        if not self._buf:
+            return
+        chunk = "".join(self._buf).encode("utf-8")
+        self._buf.clear()
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            # Ask the file for its real size (one lseek; the buffer is empty
+            # between batches) so external truncation is picked up
+            size = self.stream.seek(0, os.SEEK_END)
+            if size and size + len(chunk) >= self.maxBytes:
+                self.doRollover()
+        self.stream.write(chunk)
+        self.stream.flush()
+
+
 class EventLogger:
     """Light-weight structured logger wrapped around ``logging``."""
 
@@ -52,17 +137,42 @@ class EventLogger:
             # Never let logging cause crashes
             pass
 
-    def debug(self, message: str, **extra) -> None:
+    def debug(self, message: str | Callable[[], str], **extra) -> None:
+        """Log at DEBUG level when verbose logging is on.
+
+        The flag is checked before anything else; pass a zero-argument callable
+        as *message* to defer building an expensive message until it is needed.
+        """
         if not self._flags.verbose_logging:
             return
+        if callable(message):
+            message = message()
         self._logger.debug(message, extra={"extra_data": extra})
 
+    def flush(self) -> None:
+        """Write any buffered records to disk."""
+        for handler in self._logger.handlers:
+            handler.flush()
+
+    def clear(self) -> None:
+        """Empty the event log, discarding records still waiting to be written."""
+        for handler in self._logger.handlers:
+            if isinstance(handler, _BatchedRotatingFileHandler):
+                handler.reset()
+
     # =================== INTERNALS ===================
     def _configure(self) -> None:
         self._log_dir.mkdir(parents=True, exist_ok=True)
         for handler in list(self._logger.handlers):
             self._logger.removeHandler(handler)
-        handler = RotatingFileHandler(self._log_path, maxBytes=512_000, backupCount=3)
+            handler.close()
+        # Verbose sessions are usually being watched live, so write through
+        handler = _BatchedRotatingFileHandler(
+            self._log_path,
+            maxBytes=512_000,
+            backupCount=3,
+            batch_size=1 if self._flags.verbose_logging else 64,
+        )
         formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s %(extra_data)s')
         handler.setFormatter(formatter)
         self._logger.addHandler(handler)
@@ -35,7 +35,7 @@ class DriveServiceProtocol(Protocol):
         ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class DriveLookupResult:
     """Represents the outcome of a Drive lookup."""
 
@@ -45,6 +45,21 @@ class DriveLookupResult:
     path: str
 
 
+def _build_drive_routing() -> dict[str, str]:
+    """Expand the ``SHARED_DRIVE_IDS`` ranges ("A-F", ...) into a first-character lookup."""
+
+    routing: dict[str, str] = {}
+    for key, drive_id in ref.SHARED_DRIVE_IDS.items():
+        start, end = key.split('-')
+        for code in range(ord(start), ord(end) + 1):
+            # Earlier ranges win on overlap, matching a first-match scan
+            routing.setdefault(chr(code), drive_id)
+    return routing
+
+
+_DRIVE_BY_FIRST_CHAR = _build_drive_routing()
+
+
 # =================== DRIVE CLIENT ===================
 # High-level helper that handles shared-drive routing and path traversal.
 # Respect ``FLAGS.offline_mode`` to avoid live API calls during tests.
@@ -65,6 +80,22 @@ class DriveClient:
         self._logger = logger
         self._service_factory = service_factory
         self._service: Optional[DriveServiceProtocol] = None
+        # Online lookups keyed by (sku, normalized relative path; '' = SKU root).
+        # Folder IDs are stable within a session, so favorites x recents menus
+        # only hit the API once per distinct folder.
+        self._resolve_cache: dict[tuple[str, str], DriveLookupResult] = {}
+
+    def set_service_factory(self, service_factory: Optional[callable]) -> None:
+        """Switch to a new Drive service (e.g. after re-authenticating) and drop cached lookups."""
+
+        self._service_factory = service_factory
+        self._service = None
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Forget cached online folder lookups."""
+
+        self._resolve_cache.clear()
 
     # =================== PRIMARY OPERATIONS ===================
     def shared_drive_for_sku(self, sku: str) -> str:
@@ -73,11 +104,10 @@ class DriveClient:
         if not sku:
             raise ValueError("SKU is required")
         first = sku.strip()[0].upper()
-        for key, drive_id in ref.SHARED_DRIVE_IDS.items():
-            start, end = key.split('-')
-            if start <= first <= end:
-                self._debug(f"SKU {sku}: mapped to drive {drive_id}")
-                return drive_id
+        drive_id = _DRIVE_BY_FIRST_CHAR.get(first)
+        if drive_id is not None:
+            self._debug(f"SKU {sku}: mapped to drive {drive_id}")
+            return drive_id
         raise ValueError(f"No shared drive mapping for SKU starting with '{first}'")
 
     def locate_root_folder(self, sku: str) -> DriveLookupResult:
@@ -89,12 +119,21 @@ class DriveClient:
             self._debug(f"Offline locate root => {folder_id}")
             return DriveLookupResult(sku=sku, shared_drive_id=shared_drive, folder_id=folder_id, path="")
 
+        cached = self._resolve_cache.get((sku, ""))
+        if cached is not None:
+            return cached
         service = self._get_service()
-        folder_id = service.find_sku_root(sku, shared_drive)
+        try:
+            folder_id = service.find_sku_root(sku, shared_drive)
+        except Exception:
+            self.clear_cache()
+            raise
         if not folder_id:
             raise LookupError(f"Drive root not found for SKU '{sku}'")
         self._debug(f"Located real root folder {folder_id}")
-        return DriveLookupResult(sku=sku, shared_drive_id=shared_drive, folder_id=folder_id, path="")
+        result = DriveLookupResult(sku=sku, shared_drive_id=shared_drive, folder_id=folder_id, path="")
+        self._resolve_cache[(sku, "")] = result
+        return result
 
     def resolve_relative_path(self, sku: str, relative_path: str) -> DriveLookupResult:
         """Resolve a relative path under the SKU root.
@@ -110,9 +149,9 @@ class DriveClient:
         if not segments:
             return root
 
+        path = '/'.join(segments)
         if self._flags.offline_mode or self._service_factory is None:
-            folder_id = '/'.join([root.folder_id, *segments])
-            path = '/'.join(segments)
+            folder_id = f"{root.folder_id}/{path}"
             self._debug(f"Offline resolve path => {folder_id}")
             return DriveLookupResult(
                 sku=sku,
@@ -121,20 +160,29 @@ class DriveClient:
                 path=path,
             )
 
+        cached = self._resolve_cache.get((sku, path))
+        if cached is not None:
+            return cached
         service = self._get_service()
-        folder_id = service.resolve_relative_path(
-            shared_drive_id=root.shared_drive_id,
-            parent_id=root.folder_id,
-            segments=segments,
-        )
+        try:
+            folder_id = service.resolve_relative_path(
+                shared_drive_id=root.shared_drive_id,
+                parent_id=root.folder_id,
+                segments=segments,
+            )
+        except Exception:
+            self.clear_cache()
+            raise
         if not folder_id:
             raise LookupError(f"Could not resolve path '{relative_path}' for SKU '{sku}'")
-        return DriveLookupResult(
+        result = DriveLookupResult(
             sku=sku,
             shared_drive_id=root.shared_drive_id,
             folder_id=folder_id,
-            path='/'.join(segments),
+            path=path,
         )
+        self._resolve_cache[(sku, path)] = result
+        return result
 
     def create_child_folder(self, sku: str, parent_relative_path: Optional[str], name: str) -> DriveLookupResult:
         """Create (or get) a child folder named ``name`` under the given relative path.
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Iterable, List
+from typing import Dict, Iterable, List
 
 from ..config.settings import Settings
 
@@ -16,22 +15,30 @@ class RecentSKUHistory:
     settings: Settings
 
     def __post_init__(self) -> None:
-        self._items: Deque[str] = deque(self.settings.recent_skus, maxlen=MAX_RECENTS)
+        # Insertion-ordered set, oldest first: O(1) membership and move-to-front
+        self._order: Dict[str, None] = {}
+        for sku in reversed(self.settings.recent_skus):
+            self._push(sku)
 
     def add(self, sku: str) -> None:
         if not sku:
             return
-        if sku in self._items:
-            self._items.remove(sku)
-        self._items.appendleft(sku)
-        self.settings.recent_skus = list(self._items)
+        self._push(sku)
+        self.settings.recent_skus = self.items()
 
     def items(self) -> List[str]:
-        return list(self._items)
+        """Return the recents, most recent first."""
+        return list(reversed(self._order))
 
     def clear(self) -> None:
-        self._items.clear()
+        self._order.clear()
         self.settings.recent_skus = []
 
+    def _push(self, sku: str) -> None:
+        self._order.pop(sku, None)
+        self._order[sku] = None
+        if len(self._order) > MAX_RECENTS:
+            del self._order[next(iter(self._order))]
+
 
 # =================== END RECENT HISTORY ===================
@@ -129,6 +129,7 @@ class SettingsDialog(tk.Toplevel):
         fav_frame.columnconfigure(2, weight=1)
         fav_frame.columnconfigure(3, weight=1)
         # Prepare a style that blends disabled entry background with dialog background (transparent-like)
+        # Styles are per interpreter and theme, so configure on every open (cheap and idempotent)
         try:
             style = ttk.Style(self)
             bg = style.lookup('TFrame', 'background') or self.cget('bg') or '#f0f0f0'
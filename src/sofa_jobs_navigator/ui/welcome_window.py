@@ -3,13 +3,163 @@ from __future__ import annotations
 """Welcome / Help window with interactive onboarding controls on select pages."""
 
 import sys
+import weakref
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
+from platformdirs import user_cache_path
+
 from ..utils.app_icons import set_app_icon
 from ..version import VERSION
 
+try:
+    # Optional: Pillow gives high-quality resizing of the Help images
+    from PIL import Image as _PILImage, ImageTk as _PILImageTk  # type: ignore
+    _LANCZOS = getattr(_PILImage, 'LANCZOS', 1)
+except Exception:  # Pillow is optional
+    _PILImage = None  # type: ignore
+    _PILImageTk = None  # type: ignore
+    _LANCZOS = 1
+
+CACHE_APP_NAME = "sofa_jobs_navigator"
+HELP_IMAGE_SIZE = (600, 300)
+
+# Page indicator geometry: each dot gets a fixed slot wide enough for the active dot plus its glow
+_DOT_SLOT = 18
+_DOT_ACTIVE = 12
+_DOT_INACTIVE = 8
+_DOT_GLOW = 3
+
+# Help text for pages 1-6; page 0 embeds VERSION and is built per window
+_STATIC_PAGE_TEXTS: tuple[str, ...] = (
+    (
+        "Copy once, detect many.\n\n"
+        "Copy large texts from anywhere — file names, folder names, emails, web pages, chats — and press F12. "
+        "The app scans your clipboard and detects all SKUs. The first valid one becomes your 'CURRENT SKU' so "
+        "you can act immediately, without pasting or retyping."
+    ),
+    (
+        "Open the right remote folder instantly.\n\n"
+        "With a 'CURRENT SKU' set, a click (or hotkey) jumps straight to its Google Drive folder or a mapped subfolder. "
+        "Use F1–F8 or sidebar buttons for fast, repeatable navigation—going from Vendor-ID to working context in seconds."
+    ),
+    (
+        "Save time with Favorites.\n\n"
+        "Configure per-SKU favorites (F1–F8) pointing at your most-used remote folders. "
+        "Standardize structure and eliminate repetitive wandering through deep paths."
+    ),
+    (
+        "Recent SKUs one tap away.\n\n"
+        "The side panel keeps the last SKUs you touched. Click to copy or reuse them—tooltips show full values. "
+        "You can detect and load up to 7 SKUs at once to the recents panel, and cycle through multiple SKUs quickly while tracking parallel work."
+    ),
+    (
+        "Create a local folder named “SKU + suffix.”\n\n"
+        "Generate a consistently named local folder in one step. Clean, predictable naming helps keep local workspaces tidy."
+    ),
+    (
+        "Good to go!\n\n"
+        "If you wish to change your preferences later, just press F11.\n"
+        "Click Finish to save your choices and begin working."
+    ),
+)
+
+_HELP_ASSET_DIR = Path(__file__).resolve().parent / 'assets' / 'help'
+# Resolved once per process: Help{N}.png preferred over .webp, None when neither ships
+_HELP_CANDIDATES: dict[str, Path | None] = {
+    stem: next(
+        (p for p in (_HELP_ASSET_DIR / f'{stem}.png', _HELP_ASSET_DIR / f'{stem}.webp') if p.exists()),
+        None,
+    )
+    for stem in (f'Help{i}' for i in range(1, len(_STATIC_PAGE_TEXTS) + 2))
+}
+
+
+def _help_cache_path(src: Path, size: tuple[int, int]) -> Path:
+    """Location of the pre-sized PNG rendered from *src* on a previous run."""
+    return user_cache_path(CACHE_APP_NAME) / f'help_{size[0]}x{size[1]}' / f'{src.stem}.png'
+
+
+def _png_size(path: Path) -> tuple[int, int] | None:
+    """Read (width, height) from a PNG's IHDR header without decoding it."""
+    try:
+        with path.open('rb') as fh:
+            head = fh.read(24)
+    except OSError:
+        return None
+    if len(head) < 24 or head[:8] != b'\x89PNG\r\n\x1a\n' or head[12:16] != b'IHDR':
+        return None
+    return int.from_bytes(head[16:20], 'big'), int.from_bytes(head[20:24], 'big')
+
+
+# PhotoImages already built in this process, per Tk root (an image belongs to the
+# interpreter that created it, so the entries go away with their root)
+_PHOTO_CACHE: weakref.WeakKeyDictionary[tk.Misc, dict[tuple[str, tuple[int, int]], object]] = weakref.WeakKeyDictionary()
+
+
+def _load_help_image(master: tk.Misc, src: Path, size: tuple[int, int]):
+    """Build a PhotoImage of *src* at *size* for *master*'s interpreter."""
+    if src.suffix.lower() == '.png' and _png_size(src) == size:
+        # Already the right size: Tk >= 8.6 decodes PNG (with alpha) natively, which
+        # avoids Pillow and the slow ImageTk pixel-blit path altogether
+        try:
+            return tk.PhotoImage(master=master, file=str(src))
+        except Exception:
+            pass
+    cached = _help_cache_path(src, size)
+    try:
+        if cached.exists() and cached.stat().st_mtime >= src.stat().st_mtime:
+            return tk.PhotoImage(master=master, file=str(cached))
+    except Exception:
+        pass
+    try:
+        if _PILImage is None or _PILImageTk is None:
+            raise ImportError('Pillow not available')
+        im = _PILImage.open(str(src))
+        if im.size == size and im.mode == 'RGBA':
+            # Shipped assets are already 600x300 RGBA: nothing to convert, resize or cache
+            return _PILImageTk.PhotoImage(im, master=master)
+        try:
+            # Lets DCT formats (JPEG) decode at reduced scale; a no-op for PNG/WEBP
+            im.draft('RGBA', size)
+        except Exception:
+            pass
+        if im.mode != 'RGBA':
+            try:
+                im = im.convert('RGBA')
+            except Exception:
+                pass
+        if im.size != size:
+            im = im.resize(size, _LANCZOS)
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            im.save(str(cached), format='PNG')
+        except Exception:
+            pass
+        return _PILImageTk.PhotoImage(im, master=master)
+    except Exception:
+        try:
+            if src.suffix.lower() == '.png':
+                return tk.PhotoImage(master=master, file=str(src))
+        except Exception:
+            return None
+    return None
+
+
+def _get_photoimage(master: tk.Misc, path_str: str, size: tuple[int, int]):
+    """Return a PhotoImage of *path_str* scaled to *size*.
+
+    Memoized per Tk root so re-opening the Welcome window skips decoding entirely.
+    Across runs, the resized PNG is cached on disk and loaded directly by Tk,
+    bypassing Pillow's open/convert/resize on every start after the first.
+    """
+    cache = _PHOTO_CACHE.setdefault(master._root(), {})
+    key = (path_str, size)
+    if key not in cache:
+        cache[key] = _load_help_image(master, Path(path_str), size)
+    return cache[key]
+
 
 class WelcomeWindow(tk.Toplevel):
     """Onboarding / Help window.
@@ -56,8 +206,19 @@ class WelcomeWindow(tk.Toplevel):
         # Page state
         self._page_count = 0
         self._current_page = 0
-        self._pages: list[dict[str, object]] = []
-        self._image_refs: list[object | None] = []
+        self._pages: tuple[dict[str, object], ...] = ()
+        # One strong reference per decoded page image, keyed by page index
+        self._image_refs: dict[int, object | None] = {}
+        # Last content pushed to the image/text labels (see _update_page)
+        self._last_image_id: int | None = None
+        self._last_text: str | None = None
+        # Arrow-key navigation coalescing (see _queue_nav)
+        self._pending_nav = 0
+        self._nav_after_id: str | None = None
+        # Requested (width, height) captured once after the first layout pass
+        self._req_wh: tuple[int, int] | None = None
+        # Centering runs once (see _center_once)
+        self._centered = False
 
         self._build_ui()
         self._load_pages()
@@ -70,6 +231,9 @@ class WelcomeWindow(tk.Toplevel):
             req_h = max(600, self._root_frame.winfo_reqheight(), self.winfo_height())
             self.minsize(req_w, req_h)
             self.geometry(f"{req_w}x{req_h}")
+            self._req_wh = (req_w, req_h)
+            # Size is fixed from here on: page flips must not renegotiate the toplevel geometry
+            self.pack_propagate(False)
         except Exception:
             pass
         try:
@@ -77,12 +241,30 @@ class WelcomeWindow(tk.Toplevel):
         except Exception:
             pass
         try:
-            self.bind('<Left>', lambda e: self._go_prev())
-            self.bind('<Right>', lambda e: self._go_next())
+            self.bind('<Left>', self._go_prev_event)
+            self.bind('<Right>', self._go_next_event)
             self.bind('<Escape>', lambda e: self.destroy())
         except Exception:
             pass
 
+    def destroy(self) -> None:
+        # Callbacks still queued would fire against destroyed widgets
+        for after_id in (self._nav_after_id, getattr(self, '_banner_after_id', None)):
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._nav_after_id = self._banner_after_id = None
+        # Drop this window's references; the images themselves stay in the per-root
+        # _PHOTO_CACHE for the next Welcome window and are released with the root
+        try:
+            self._img_label.image = None
+            self._image_refs.clear()
+        except Exception:
+            pass
+        super().destroy()
+
     # ---------- UI Construction ----------
     def _build_ui(self) -> None:
         root_frame = ttk.Frame(self, padding=14)
@@ -91,15 +273,23 @@ class WelcomeWindow(tk.Toplevel):
 
         content = ttk.Frame(root_frame)
         content.pack(fill='both', expand=True)
-        for _ in range(2):
-            ttk.Frame(content, height=8).pack(fill='x')
+        self._content_frame = content
+        # Non-modal warning banner; overlaid on top of the content only while it has a message
+        self._banner_var = tk.StringVar(value='')
+        self._banner = ttk.Label(
+            root_frame, textvariable=self._banner_var, foreground='#a05000', wraplength=560, justify='center', anchor='center'
+        )
+        self._banner_after_id: str | None = None
         self._img_label = tk.Label(content, bd=0)
-        self._img_label.pack(pady=(0, 8))
+        self._img_label.pack(pady=(16, 8))
         self._text_label = ttk.Label(content, text='', wraplength=420, justify='center')
         self._text_label.pack(pady=(0, 8))
         ttk.Separator(root_frame, orient='horizontal').pack(fill='x', padx=8, pady=(4, 4))
-        self._extra_frame = ttk.Frame(root_frame)
+        # Vertical padding replaces the spacer frames that used to surround each page's controls
+        self._extra_frame = ttk.Frame(root_frame, padding=(0, 16))
         self._extra_frame.pack(fill='x')
+        self._extra_panels: dict[int, ttk.Frame | None] = {}
+        self._shown_panel: ttk.Frame | None = None
 
         nav = ttk.Frame(root_frame)
         nav.pack(fill='x', pady=(4, 0))
@@ -107,92 +297,118 @@ class WelcomeWindow(tk.Toplevel):
         self._btn_prev.pack(side='left')
         dots_holder = ttk.Frame(nav)
         dots_holder.pack(side='left', expand=True)
-        self._dots_frame = ttk.Frame(dots_holder)
-        self._dots_frame.pack()
+        # One canvas for all page dots; items are created once in _load_pages and restyled on navigation
+        self._dots_canvas = tk.Canvas(dots_holder, height=20, width=0, highlightthickness=0, bd=0)
+        self._dots_canvas.pack()
+        self._dot_ids: list[int] = []
+        self._dot_glow_id: int | None = None
         self._btn_next = ttk.Button(nav, text='Next', command=self._go_next)
         self._btn_next.pack(side='right')
 
     # ---------- Pages Data ----------
     def _load_pages(self) -> None:
-        base = Path(__file__).resolve().parent / 'assets' / 'help'
-        self._pages.clear(); self._image_refs.clear()
-        texts = [
-            (
-                f"Welcome to Sofa Jobs Navigator® – {VERSION}.\n\n"
-                "Copy any Vendor-ID or SKU, press F12, and jump straight to the correct Google Drive folder. "
-                "Work directly in your browser to avoid sync conflicts, forced app updates, cache corruption, "
-                "disk space issues, and crashes. The browser is reliable, consistent, and instant."
-            ),
-            (
-                "Copy once, detect many.\n\n"
-                "Copy large texts from anywhere — file names, folder names, emails, web pages, chats — and press F12. "
-                "The app scans your clipboard and detects all SKUs. The first valid one becomes your 'CURRENT SKU' so "
-                "you can act immediately, without pasting or retyping."
-            ),
-            (
-                "Open the right remote folder instantly.\n\n"
-                "With a 'CURRENT SKU' set, a click (or hotkey) jumps straight to its Google Drive folder or a mapped subfolder. "
-                "Use F1–F8 or sidebar buttons for fast, repeatable navigation—going from Vendor-ID to working context in seconds."
-            ),
-            (
-                "Save time with Favorites.\n\n"
-                "Configure per-SKU favorites (F1–F8) pointing at your most-used remote folders. "
-                "Standardize structure and eliminate repetitive wandering through deep paths."
-            ),
-            (
-                "Recent SKUs one tap away.\n\n"
-                "The side panel keeps the last SKUs you touched. Click to copy or reuse them—tooltips show full values. "
-                "You can detect and load up to 7 SKUs at once to the recents panel, and cycle through multiple SKUs quickly while tracking parallel work."
-            ),
-            (
-                "Create a local folder named “SKU + suffix.”\n\n"
-                "Generate a consistently named local folder in one step. Clean, predictable naming helps keep local workspaces tidy."
-            ),
-            (
-                "Good to go!\n\n"
-                "If you wish to change your preferences later, just press F11.\n"
-                "Click Finish to save your choices and begin working."
-            ),
-        ]
-        for idx, text in enumerate(texts, start=1):
-            img = self._load_image_variant(base, f'Help{idx}')
-            self._pages.append({'image': img, 'text': text})
-            self._image_refs.append(img)
+        self._image_refs.clear()
+        page0_text = (
+            f"Welcome to Sofa Jobs Navigator® – {VERSION}.\n\n"
+            "Copy any Vendor-ID or SKU, press F12, and jump straight to the correct Google Drive folder. "
+            "Work directly in your browser to avoid sync conflicts, forced app updates, cache corruption, "
+            "disk space issues, and crashes. The browser is reliable, consistent, and instant."
+        )
+        texts = (page0_text, *_STATIC_PAGE_TEXTS)
         self._page_count = len(texts)
+        # Images are decoded lazily on first visit (see _page_image)
+        self._pages = tuple(
+            {'image_stem': f'Help{idx}', 'text': text} for idx, text in enumerate(texts, start=1)
+        )
+        self._create_indicators()
 
-    @staticmethod
-    def _load_image_variant(base: Path, stem: str):
-        target_size = (600, 300)
-        candidates = [base / f'{stem}.png', base / f'{stem}.webp']
-        img_path = next((p for p in candidates if p.exists()), None)
-        if not img_path:
+    def _create_indicators(self) -> None:
+        canvas = self._dots_canvas
+        canvas.delete('all')
+        slot = _DOT_SLOT
+        canvas.configure(width=self._page_count * slot, height=20)
+        # Glow sits below the dots and is moved under whichever page is active
+        self._dot_glow_id = canvas.create_oval(0, 0, 0, 0, fill='#eaeaea', outline='')
+        self._dot_ids = [canvas.create_oval(0, 0, 0, 0) for _ in range(self._page_count)]
+
+    def _page_image(self, idx: int):
+        """Return the image for page *idx*, decoding it on first request."""
+        if not (0 <= idx < self._page_count):
             return None
+        if idx not in self._image_refs:
+            stem = str(self._pages[idx].get('image_stem') or '')
+            self._image_refs[idx] = self._load_image_variant(stem)
+        return self._image_refs[idx]
+
+    def _prefetch_page_image(self, idx: int) -> None:
         try:
-            from PIL import Image, ImageTk  # type: ignore
-            im = Image.open(str(img_path))
-            try:
-                im = im.convert('RGBA')
-            except Exception:
-                pass
-            resample = getattr(__import__('PIL').Image, 'LANCZOS', 1)
-            im = im.resize(target_size, resample)
-            return ImageTk.PhotoImage(im)
+            if int(self.winfo_exists()):
+                self._page_image(idx)
         except Exception:
-            try:
-                if img_path.suffix.lower() == '.png':
-                    return tk.PhotoImage(file=str(img_path))
-            except Exception:
-                return None
-        return None
+            pass
+
+    def _load_image_variant(self, stem: str):
+        img_path = _HELP_CANDIDATES.get(stem)
+        if not img_path:
+            return None
+        return _get_photoimage(self, str(img_path), HELP_IMAGE_SIZE)
 
     # ---------- Navigation ----------
     def _go_prev(self) -> None:
+        if self._retreat():
+            self._update_page()
+
+    def _go_next(self) -> None:
+        if self._advance():
+            self._update_page()
+
+    def _go_prev_event(self, event=None) -> None:
+        self._queue_nav(-1)
+
+    def _go_next_event(self, event=None) -> None:
+        self._queue_nav(1)
+
+    def _queue_nav(self, step: int) -> None:
+        """Coalesce rapid arrow-key presses into one render per 40 ms window.
+
+        Presses arriving while a flush is already scheduled only accumulate, so a
+        held key skips intermediate pages yet still shows progress while held.
+        """
+        self._pending_nav += step
+        if self._nav_after_id is None:
+            self._nav_after_id = self.after(40, self._apply_nav)
+
+    def _apply_nav(self) -> None:
+        self._nav_after_id = None
+        steps, self._pending_nav = self._pending_nav, 0
+        moved = False
+        while steps:
+            if steps > 0:
+                ok = self._advance(); steps -= 1
+            else:
+                ok = self._retreat(); steps += 1
+            if not ok:
+                break
+            moved = True
+        try:
+            if moved and int(self.winfo_exists()):
+                self._update_page()
+        except Exception:
+            pass
+
+    def _retreat(self) -> bool:
+        """Step back one page without rendering; returns True if the page changed."""
         if self._current_page <= 0:
-            return
+            return False
         self._current_page -= 1
-        self._update_page()
+        return True
 
-    def _go_next(self) -> None:
+    def _advance(self) -> bool:
+        """Validate and step forward one page without rendering.
+
+        Returns True if the page changed; False if the user stayed put or the
+        window was closed from the final page.
+        """
         # Validation and warnings for specific pages
         try:
             # Page 1 (index 0): Check connection status
@@ -207,33 +423,30 @@ class WelcomeWindow(tk.Toplevel):
                         parent=self,
                     )
                     if not proceed:
-                        return
+                        return False
             
             # Page 6 (index 5): Validate working folder
             if self._current_page == 5 and self._settings is not None:
                 wf = (self._settings.working_folder or '').strip()
                 # Check if working folder is empty or invalid
                 if not wf:
-                    messagebox.showwarning(
-                        title='Working Folder Not Set',
-                        message='Without a Working Folder you won\'t be able to create SKU folders in one click.\n\nYou can press F11 later to open Settings and configure it.',
-                        parent=self,
+                    self._show_banner(
+                        'Working Folder not set: you won\'t be able to create SKU folders in one click. '
+                        'You can press F11 later to open Settings and configure it.'
                     )
                 else:
                     # Check if the folder actually exists
                     try:
                         folder_path = Path(wf)
                         if not folder_path.exists() or not folder_path.is_dir():
-                            messagebox.showwarning(
-                                title='Working Folder Invalid',
-                                message=f'The Working Folder path is not valid or does not exist:\n{wf}\n\nYou won\'t be able to create SKU folders in one click. You can press F11 later to open Settings and configure it.',
-                                parent=self,
+                            self._show_banner(
+                                f'Working Folder is not valid or does not exist: {wf}\n'
+                                'You won\'t be able to create SKU folders in one click. You can press F11 later to configure it.'
                             )
                     except Exception:
-                        messagebox.showwarning(
-                            title='Working Folder Invalid',
-                            message=f'The Working Folder path is not valid:\n{wf}\n\nYou won\'t be able to create SKU folders in one click. You can press F11 later to open Settings and configure it.',
-                            parent=self,
+                        self._show_banner(
+                            f'Working Folder is not valid: {wf}\n'
+                            'You won\'t be able to create SKU folders in one click. You can press F11 later to configure it.'
                         )
         except Exception:
             pass
@@ -266,59 +479,120 @@ class WelcomeWindow(tk.Toplevel):
                 pass
         if self._current_page < self._page_count - 1:
             self._current_page += 1
-            self._update_page()
-        else:
+            return True
+        try:
+            self.destroy()
+        except Exception:
+            pass
+        return False
+
+    def _show_banner(self, message: str) -> None:
+        """Show *message* over the top of the page and auto-dismiss it after a few seconds.
+
+        The window size is fixed, so the banner is overlaid with place() rather than
+        packed: packing it would push the nav row (and Finish) off the bottom.
+        """
+        self._banner_var.set(message)
+        if not self._banner.winfo_manager():
+            self._banner.place(in_=self._content_frame, relx=0.5, y=0, anchor='n', relwidth=1.0)
+            self._banner.lift()
+        if self._banner_after_id is not None:
             try:
-                self.destroy()
+                self.after_cancel(self._banner_after_id)
             except Exception:
                 pass
+        self._banner_after_id = self.after(4000, self._clear_banner)
+
+    def _clear_banner(self) -> None:
+        self._banner_after_id = None
+        self._banner_var.set('')
+        try:
+            self._banner.place_forget()
+        except Exception:
+            pass
 
     # ---------- Rendering ----------
     def _update_page(self) -> None:
-        if not (0 <= self._current_page < self._page_count):
+        current = self._current_page
+        page_count = self._page_count
+        if not (0 <= current < page_count):
             return
-        page = self._pages[self._current_page]
-        img = page.get('image'); txt = page.get('text')
-        self._img_label.configure(image=img if img else '')
-        self._img_label.image = img
-        self._text_label.configure(text=str(txt or ''))
-        self._btn_prev.state(['disabled'] if self._current_page == 0 else ['!disabled'])
-        self._btn_next.configure(text='Finish' if self._current_page == self._page_count - 1 else 'Next')
+        img_label = self._img_label
+        page = self._pages[current]
+        img = self._page_image(current); txt = page.get('text')
+        # Only touch the labels when their content actually changes (each configure is a Tcl round-trip)
+        if id(img) != self._last_image_id:
+            img_label.configure(image=img if img else '')
+            self._last_image_id = id(img)
+        if img is not None:
+            # Keep the displayed image alive on the label itself as well (Tk holds no Python ref)
+            img_label.image = img
+        text = str(txt or '')
+        if text != self._last_text:
+            self._text_label.configure(text=text)
+            self._last_text = text
+        self._btn_prev.state(['disabled'] if current == 0 else ['!disabled'])
+        self._btn_next.configure(text='Finish' if current == page_count - 1 else 'Next')
         self._render_indicators()
-        self._render_extra_controls()
+        self._ensure_extra_controls(current)
         # If we're on page 0 and the Connect button exists, update its appearance
-        if self._current_page == 0:
+        if current == 0:
             self.after(10, self._update_connect_button_appearance)  # Small delay to ensure button is created
-        self.after(0, self._center_once)
+        # Decode the next page's image while the user reads this one
+        nxt = current + 1
+        if nxt < page_count and nxt not in self._image_refs:
+            self.after_idle(self._prefetch_page_image, nxt)
 
     def _render_indicators(self) -> None:
-        for child in list(self._dots_frame.winfo_children()):
-            child.destroy()
-        pad = 6
-        for i in range(self._page_count):
-            active = (i == self._current_page)
-            size = 12 if active else 8
-            c = tk.Canvas(self._dots_frame, width=size + pad, height=size + pad, highlightthickness=0, bd=0)
-            c.pack(side='left')
-            x0 = pad // 2; y0 = pad // 2; x1 = x0 + size; y1 = y0 + size
-            if active:
-                glow_pad = 3
-                c.create_oval(x0 - glow_pad, y0 - glow_pad, x1 + glow_pad, y1 + glow_pad, fill='#eaeaea', outline='')
-                c.create_oval(x0, y0, x1, y1, fill='#ffffff', outline='#d0d0d0')
+        canvas = self._dots_canvas
+        current = self._current_page
+        glow_id = self._dot_glow_id
+        slot = _DOT_SLOT
+        cy = 10
+        for i, oid in enumerate(self._dot_ids):
+            cx = i * slot + slot // 2
+            if i == current:
+                r = _DOT_ACTIVE // 2
+                canvas.coords(oid, cx - r, cy - r, cx + r, cy + r)
+                canvas.itemconfigure(oid, fill='#ffffff', outline='#d0d0d0')
+                if glow_id is not None:
+                    g = r + _DOT_GLOW
+                    canvas.coords(glow_id, cx - g, cy - g, cx + g, cy + g)
             else:
-                c.create_oval(x0, y0, x1, y1, fill='#cfcfcf', outline='#d9d9d9')
+                r = _DOT_INACTIVE // 2
+                canvas.coords(oid, cx - r, cy - r, cx + r, cy + r)
+                canvas.itemconfigure(oid, fill='#cfcfcf', outline='#d9d9d9')
 
-    def _render_extra_controls(self) -> None:
-        for child in list(self._extra_frame.winfo_children()):
-            child.destroy()
-        p = self._current_page
-        if p not in (0, 1, 2, 3, 4, 5, 6):
+    def _ensure_extra_controls(self, p: int) -> None:
+        """Show the control panel for page *p*, building it on first visit.
+
+        Panels are cached and swapped with pack_forget/pack, so revisiting a page
+        allocates no widgets and keeps whatever the user already toggled there.
+        """
+        panels = self._extra_panels
+        if p not in panels:
+            panels[p] = self._build_extra_panel(p)
+        elif p == 5 and panels[p] is not None:
+            # The working folder may have changed in Settings since the panel was built
+            self._refresh_working_folder()
+        panel = panels[p]
+        shown = self._shown_panel
+        if shown is panel:
             return
-        for _ in range(2):
-            ttk.Frame(self._extra_frame, height=8).pack(fill='x')
+        if shown is not None:
+            shown.pack_forget()
+        if panel is not None:
+            panel.pack(fill='x')
+        self._shown_panel = panel
+
+    def _build_extra_panel(self, p: int) -> ttk.Frame | None:
+        if p not in (0, 1, 2, 3, 4, 5, 6):
+            return None
+        # Controls are built into a detached panel; the caller packs it once when complete.
+        panel = ttk.Frame(self._extra_frame)
         try:
             if p == 0:
-                row = ttk.Frame(self._extra_frame); row.pack()
+                row = ttk.Frame(panel); row.pack()
                 ttk.Label(row, text='To begin, we must connect to Google Drive.').pack(side='left')
                 
                 # Create Connect button and store reference
@@ -331,7 +605,7 @@ class WelcomeWindow(tk.Toplevel):
                 self._update_connect_button_appearance()
                 
                 # Add Connect on Startup checkbox (centered below)
-                connect_cb_frame = ttk.Frame(self._extra_frame)
+                connect_cb_frame = ttk.Frame(panel)
                 connect_cb_frame.pack(pady=(8, 0))
                 connect_default = True  # Checked in Welcome to set up auto-connect going forward
                 self._connect_var = tk.BooleanVar(value=connect_default)
@@ -339,7 +613,7 @@ class WelcomeWindow(tk.Toplevel):
                 ttk.Label(connect_cb_frame, text='Connect on Startup').pack(side='left')
             elif p == 1:
                 # Add Auto Search clipboard checkbox to page 2 (centered)
-                auto_search_cb_frame = ttk.Frame(self._extra_frame)
+                auto_search_cb_frame = ttk.Frame(panel)
                 auto_search_cb_frame.pack()
                 auto_search_default = True  # Default to True in Welcome
                 self._auto_search_after_var = tk.BooleanVar(value=auto_search_default)
@@ -347,40 +621,32 @@ class WelcomeWindow(tk.Toplevel):
                 ttk.Label(auto_search_cb_frame, text='Auto-search clipboard after connect').pack(side='left')
             elif p == 2:
                 # Add Auto open root checkbox to page 3 (centered)
-                auto_open_cb_frame = ttk.Frame(self._extra_frame)
+                auto_open_cb_frame = ttk.Frame(panel)
                 auto_open_cb_frame.pack()
                 auto_open_default = False  # Default to False
                 self._open_root_var = tk.BooleanVar(value=auto_open_default)
                 ttk.Checkbutton(auto_open_cb_frame, variable=self._open_root_var).pack(side='left', padx=(0, 6))
                 ttk.Label(auto_open_cb_frame, text='Open root folder on SKU found').pack(side='left')
             elif p == 3:
-                row = ttk.Frame(self._extra_frame); row.pack()
+                row = ttk.Frame(panel); row.pack()
                 ttk.Label(row, text='You can set your favorite shortcuts in the settings now, or press F11 later.').pack(side='left')
                 ttk.Button(row, text='Set Favorites', command=self._on_press_open_settings).pack(side='left', padx=(12, 0))
             elif p == 4:
                 # Add Auto load multiple checkbox to page 5 (centered)
-                auto_load_cb_frame = ttk.Frame(self._extra_frame)
+                auto_load_cb_frame = ttk.Frame(panel)
                 auto_load_cb_frame.pack()
                 auto_load_default = False  # Default to False
                 self._auto_load_multi_var = tk.BooleanVar(value=auto_load_default)
                 ttk.Checkbutton(auto_load_cb_frame, variable=self._auto_load_multi_var).pack(side='left', padx=(0, 6))
                 ttk.Label(auto_load_cb_frame, text='Auto-load multiple SKUs (no prompt)').pack(side='left')
             elif p == 5:
-                ttk.Label(self._extra_frame, text='Choose your Working Folder, where you keep your projects:').pack(anchor='w')
-                browse = ttk.Frame(self._extra_frame); browse.pack(fill='x', pady=(4, 0))
-                # Get current working folder from settings, display current path if already set
-                current = '' if not self._settings else (self._settings.working_folder or '')
-                if current:
-                    # Show current path with better formatting
-                    display_text = f'Current: {current}'
-                else:
-                    display_text = '(no folder selected)'
-                self._wf_var = tk.StringVar(value=display_text)
+                ttk.Label(panel, text='Choose your Working Folder, where you keep your projects:').pack(anchor='w')
+                browse = ttk.Frame(panel); browse.pack(fill='x', pady=(4, 0))
+                self._wf_var = tk.StringVar(value='')
                 self._wf_entry = ttk.Entry(browse, textvariable=self._wf_var, width=54, state='readonly')
                 self._wf_entry.pack(side='left', padx=(0, 6))
                 ttk.Button(browse, text='Browse…', command=self._pick_working_folder).pack(side='left')
-                # Store the actual path separately for validation
-                self._actual_wf_path = current
+                self._refresh_working_folder()
             elif p == 6:
                 # Page 7: Final settings page with remaining controls (Sounds + Show Welcome)
                 # Initialize variables for any controls not yet created on other pages
@@ -389,27 +655,22 @@ class WelcomeWindow(tk.Toplevel):
                     self._sounds_var = tk.BooleanVar(value=sounds_default)
                 
                 # Center the Sounds control on page 7
-                sounds_cb_frame = ttk.Frame(self._extra_frame)
+                sounds_cb_frame = ttk.Frame(panel)
                 sounds_cb_frame.pack()
                 ttk.Checkbutton(sounds_cb_frame, variable=self._sounds_var).pack(side='left', padx=(0, 6))
                 ttk.Label(sounds_cb_frame, text='Sounds On').pack(side='left')
 
                 # Show Welcome on Startup toggle
-                for _ in range(1):
-                    ttk.Frame(self._extra_frame, height=8).pack(fill='x')
-                show_welcome_frame = ttk.Frame(self._extra_frame)
-                show_welcome_frame.pack()
+                show_welcome_frame = ttk.Frame(panel)
+                show_welcome_frame.pack(pady=(8, 0))
                 default_sw = True if self._settings is None else bool(getattr(self._settings, 'show_help_on_startup', True))
                 self._show_welcome_var = tk.BooleanVar(value=default_sw)
                 ttk.Checkbutton(show_welcome_frame, variable=self._show_welcome_var).pack(side='left', padx=(0, 6))
                 ttk.Label(show_welcome_frame, text='Show Welcome Window on Startup').pack(side='left')
 
                 # Add Home key instruction
-                for _ in range(2):
-                    ttk.Frame(self._extra_frame, height=8).pack(fill='x')
-                
-                home_key_frame = ttk.Frame(self._extra_frame)
-                home_key_frame.pack()
+                home_key_frame = ttk.Frame(panel)
+                home_key_frame.pack(pady=(16, 0))
                 ttk.Label(
                     home_key_frame, 
                     text='💡 Tip: Press Home key anytime to reopen this Welcome Window',
@@ -417,8 +678,7 @@ class WelcomeWindow(tk.Toplevel):
                 ).pack()
         except Exception:
             pass
-        for _ in range(2):
-            ttk.Frame(self._extra_frame, height=8).pack(fill='x')
+        return panel
 
     # ---------- Actions ----------
     def _on_press_auth(self) -> None:
@@ -461,42 +721,11 @@ class WelcomeWindow(tk.Toplevel):
                 # Change to green "Connected" state
                 self._connect_button.configure(text='Connected')
                 
-                # For reliable green styling, always use tk.Button on macOS/darwin
-                # ttk styling is too limited on native macOS themes
+                # ttk styling is too limited on native themes (notably macOS), so the
+                # green state is always rendered with a plain tk.Button
                 styling_success = False
                 
-                # Check if we're on macOS or if we want to force tk.Button for green styling
-                use_tk_button = (sys.platform == 'darwin') or True  # Force tk.Button for reliable styling
-                
-                if not use_tk_button:
-                    # Approach 1: Try ttk styling first (for non-macOS platforms)
-                    try:
-                        style = ttk.Style()
-                        style_name = 'Connected.TButton'
-                        
-                        style.configure(
-                            style_name,
-                            background='#28a745',
-                            foreground='white',
-                            focuscolor='none',
-                            relief='raised',
-                            borderwidth=1
-                        )
-                        style.map(
-                            style_name,
-                            background=[('active', '#218838'), ('pressed', '#1e7e34')],
-                            foreground=[('active', 'white'), ('pressed', 'white')],
-                            relief=[('pressed', 'sunken')]
-                        )
-                        
-                        self._connect_button.configure(style=style_name)
-                        styling_success = True
-                        
-                    except Exception as e:
-                        print(f"TTK styling failed: {e}")
-                
-                # Approach 2: Use tk.Button for reliable cross-platform green styling
-                if not styling_success and hasattr(self, '_connect_button'):
+                if hasattr(self, '_connect_button'):
                     try:
                         # Get the parent and position of the current button
                         parent = self._connect_button.master
@@ -571,6 +800,23 @@ class WelcomeWindow(tk.Toplevel):
             print(f"Connect button appearance update failed: {e}")
             pass
 
+    def _refresh_working_folder(self) -> None:
+        """Show the working folder currently in settings on page 5."""
+        # Get current working folder from settings (without settings, keep the last pick)
+        if self._settings is None:
+            current = getattr(self, '_actual_wf_path', '') or ''
+        else:
+            current = self._settings.working_folder or ''
+        if current:
+            # Show current path with better formatting
+            display_text = f'Current: {current}'
+        else:
+            display_text = '(no folder selected)'
+        if self._wf_var.get() != display_text:
+            self._wf_var.set(display_text)
+        # Store the actual path separately for validation
+        self._actual_wf_path = current
+
     def _pick_working_folder(self) -> None:
         # Use the actual path stored separately, not the display text
         current = getattr(self, '_actual_wf_path', '') or ''
@@ -621,11 +867,15 @@ class WelcomeWindow(tk.Toplevel):
 
     # ---------- Utility ----------
     def _center_once(self) -> None:
-        if getattr(self, '_centered', False):
+        if self._centered:
             return
         self._centered = True
-        self.update_idletasks()
-        w = self.winfo_reqwidth() or self.winfo_width(); h = self.winfo_reqheight() or self.winfo_height()
+        if self._req_wh is not None:
+            # Reuse the size measured during __init__ instead of forcing another idle pass
+            w, h = self._req_wh
+        else:
+            self.update_idletasks()
+            w = self.winfo_reqwidth() or self.winfo_width(); h = self.winfo_reqheight() or self.winfo_height()
         parent = self.master if isinstance(self.master, tk.Misc) else None
         if parent is not None:
             try:
@@ -6,12 +6,19 @@ from available PNG/ICO resources in this workspace.
 
 from __future__ import annotations
 
+import json
 import os
 import sys
+import weakref
 import platform
 from pathlib import Path
+from typing import Any, Callable
 import tkinter as tk
 
+from platformdirs import user_cache_path
+
+__all__ = ["set_app_icon", "resource_path"]
+
 try:
     # Optional: if Pillow is available we can convert/shape icons for macOS
     from PIL import Image, ImageTk, ImageDraw  # type: ignore
@@ -19,6 +26,16 @@ except Exception:  # Pillow is optional
     Image = None  # type: ignore
     ImageTk = None  # type: ignore
 
+# The platform cannot change while the process runs
+_SYSTEM = platform.system()
+
+CACHE_APP_NAME = "sofa_jobs_navigator"
+
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# Rounded Dock-style icon generated by tools/render_mac_icon.py
+MACOS_ICON_PATH = _MODULE_DIR.parent / "ui" / "assets" / "sofa_icon_macos.png"
+
 
 def resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -26,7 +43,113 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+# Resolved icon paths keyed by the env override in effect when they were computed.
+# Icon files do not move while the app runs, so every window after the first
+# reuses the result instead of re-probing dozens of directories.
+_CACHED_PATHS: tuple[tuple[str | None, str | None], tuple[str | None, str | None]] | None = None
+
+
+def _reset_icon_cache() -> None:
+    """Forget the memoized icon paths (e.g. after changing SJN_ICON in tests)."""
+    global _CACHED_PATHS
+    _CACHED_PATHS = None
+
+
+def _env_key() -> tuple[str | None, str | None]:
+    return (os.environ.get("SJN_ICON"), os.environ.get("SJN_ICON_FILE"))
+
+
 def _iter_candidate_paths() -> tuple[str | None, str | None]:
+    """Return best-effort (png_path, ico_path), memoized per env override."""
+    global _CACHED_PATHS
+    env_key = _env_key()
+    if _CACHED_PATHS is not None and _CACHED_PATHS[0] == env_key:
+        return _CACHED_PATHS[1]
+    result = _load_persisted_paths(env_key)
+    if result is None:
+        result = _scan_candidate_paths()
+        _persist_paths(env_key, result)
+    _CACHED_PATHS = (env_key, result)
+    return result
+
+
+# =================== PERSISTENT PATH CACHE ===================
+# The paths found by the last run are kept on disk and reused on the next
+# start as long as every file still has the same mtime, skipping the walk.
+# -------------------------------------------------------------
+
+
+def _icon_cache_file() -> Path:
+    return user_cache_path(CACHE_APP_NAME) / "icon_paths.json"
+
+
+def _install_key() -> list[str | None]:
+    """Where this copy of the app lives; a moved or second install must rescan."""
+    return [str(_MODULE_DIR), getattr(sys, "_MEIPASS", None)]
+
+
+def _load_persisted_paths(env_key: tuple[str | None, str | None]) -> tuple[str | None, str | None] | None:
+    """Return the previous run's (png_path, ico_path) if still valid, else ``None``."""
+    try:
+        data = json.loads(_icon_cache_file().read_text(encoding="utf-8"))
+        if tuple(data["env"]) != env_key or data["base"] != _install_key():
+            return None
+        for path, mtime in data["mtimes"].items():
+            if os.stat(path).st_mtime != mtime:
+                return None
+        return data["png"], data["ico"]
+    except Exception:
+        return None
+
+
+def _persist_paths(env_key: tuple[str | None, str | None], result: tuple[str | None, str | None]) -> None:
+    if not any(result):
+        return
+    try:
+        png_path, ico_path = result
+        payload = {
+            "env": list(env_key),
+            "base": _install_key(),
+            "png": png_path,
+            "ico": ico_path,
+            "mtimes": {p: os.stat(p).st_mtime for p in result if p},
+        }
+        target = _icon_cache_file()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(payload), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def _build_probe_dirs() -> tuple[Path, ...]:
+    """Directories to probe for icons, most likely hits first."""
+    dirs: list[Path] = []
+    try:
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass:
+            dirs.append(Path(meipass))
+    except Exception:
+        pass
+    # Prefer package/module directories and project roots first; help assets scanned later as last resort
+    dirs.append(_MODULE_DIR)
+    dirs.append(_MODULE_DIR.parent)
+    # Also probe parents up to 5 levels (covers src/, project root, etc.)
+    for i, parent in enumerate(_MODULE_DIR.parents):
+        if i >= 5:
+            break
+        dirs.append(parent)
+        # Common sibling project folders at each level
+        for sibling in ("JOBS NAVIGATOR", "JOBS_NAVIGATOR", "DRIVE_OPERATOR", "NAVIGATOR"):
+            dirs.append(parent / sibling)
+    return tuple(dirs)
+
+
+# The install location does not change at runtime, so resolve it once
+_BASE_DIRS = _build_probe_dirs()
+_HELP_DIR = _MODULE_DIR.parent / "ui" / "assets" / "help"
+
+
+def _scan_candidate_paths() -> tuple[str | None, str | None]:
     """Return best-effort (png_path, ico_path) by scanning common locations.
 
     Search order:
@@ -67,27 +190,7 @@ def _iter_candidate_paths() -> tuple[str | None, str | None]:
     except Exception:
         pass
 
-    # 2) Build list of directories to probe
-    dirs: list[Path] = []
-    try:
-        meipass = getattr(sys, "_MEIPASS", None)
-        if meipass:
-            dirs.append(Path(meipass))
-    except Exception:
-        pass
-
-    mod_dir = Path(__file__).resolve().parent
-    # Prefer package/module directories and project roots first; help assets scanned later as last resort
-    dirs.extend([mod_dir, mod_dir.parent])
-
-    # Also probe parents up to 5 levels (covers src/, project root, etc.)
-    for i, parent in enumerate(mod_dir.parents):
-        if i >= 5:
-            break
-        dirs.append(parent)
-        # Common sibling project folders at each level
-        for sibling in ("JOBS NAVIGATOR", "JOBS_NAVIGATOR", "DRIVE_OPERATOR", "NAVIGATOR"):
-            dirs.append(parent / sibling)
+    # 2) Directories to probe (precomputed in _BASE_DIRS), most likely hits first
 
     # 3) Define preferred filenames (case-insensitive match)
     name_order = [
@@ -103,13 +206,25 @@ def _iter_candidate_paths() -> tuple[str | None, str | None]:
     def find_in_dir(d: Path) -> None:
         nonlocal png_path, ico_path
         try:
-            if not d.exists() or not d.is_dir():
+            if not d.is_dir():
                 return
-            lower_map = {p.name.lower(): p for p in d.iterdir() if p.is_file()}
+            # Probe exact names first (one stat each); only case-sensitive Linux
+            # filesystems need the directory listing for odd capitalisation.
+            lower_map: dict[str, str] | None = None
             for nm in name_order:
-                p = lower_map.get(nm.lower())
-                if p is None:
-                    continue
+                p = d / nm
+                if not p.is_file():
+                    if not sys.platform.startswith("linux"):
+                        continue
+                    if lower_map is None:
+                        # scandir reuses the d_type from readdir, so regular
+                        # entries need no extra stat
+                        with os.scandir(d) as entries:
+                            lower_map = {e.name.lower(): e.path for e in entries if e.is_file()}
+                    hit = lower_map.get(nm.lower())
+                    if hit is None:
+                        continue
+                    p = Path(hit)
                 if p.suffix.lower() == ".png" and png_path is None:
                     png_path = str(p)
                 if p.suffix.lower() == ".ico" and ico_path is None:
@@ -119,15 +234,14 @@ def _iter_candidate_paths() -> tuple[str | None, str | None]:
         except Exception:
             return
 
-    for d in dirs:
+    for d in _BASE_DIRS:
         find_in_dir(d)
         if png_path and ico_path:
-            break
+            return png_path, ico_path
 
     # If nothing found yet, scan help assets directory only now (very last resort)
     if not png_path and not ico_path:
-        help_dir = mod_dir.parent / "ui" / "assets" / "help"
-        find_in_dir(help_dir)
+        find_in_dir(_HELP_DIR)
 
     # 4) As a last resort, try resource_path for classic relative candidates
     try:
@@ -157,6 +271,8 @@ def _iter_candidate_paths() -> tuple[str | None, str | None]:
                     png_path = p
                 if p.lower().endswith(".ico") and ico_path is None:
                     ico_path = p
+                if png_path and ico_path:
+                    break
     except Exception:
         pass
 
@@ -171,10 +287,83 @@ def set_app_icon(window: tk.Misc) -> None:
     - macOS/Linux: prefer `.png` via `iconphoto`. If only `.ico` is available and Pillow is installed,
       convert in-memory to a PhotoImage and apply via `iconphoto`.
     Searches for common icon file names in both this project and DRIVE_OPERATOR.
+
+    The path search and decode are deferred until Tk is idle, so the window is
+    drawn first and the icon appears a frame later.
     """
 
+    try:
+        window.after_idle(_apply_icon_now, window)
+    except Exception:
+        _apply_icon_now(window)
+
+
+# Decoded icon images per Tk root, keyed by (source path, variant). The same image
+# is applied to every window of that root, and the reference keeps Tk from dropping
+# it; an image belongs to the interpreter that created it, so entries go with their root.
+_PHOTO_CACHE: weakref.WeakKeyDictionary[tk.Misc, dict[tuple[str, str], Any]] = weakref.WeakKeyDictionary()
+
+
+def _cached_photo(window: tk.Misc, path: str, variant: str, build: Callable[[tk.Misc], Any]) -> Any:
+    """Return *window*'s root's image for (*path*, *variant*), building it on first use.
+
+    *build* receives the root to use as the image's ``master``.
+    """
+    root = window._root()
+    cache = _PHOTO_CACHE.setdefault(root, {})
+    key = (path, variant)
+    img = cache.get(key)
+    if img is None:
+        img = build(root)
+        cache[key] = img
+    return img
+
+
+def _compose_macos_icon(pil: Any) -> Any:
+    """Shrink the icon and round its corners to match the macOS Dock look.
+
+    Shared with ``tools/render_mac_icon.py``, which bakes the result into
+    ``ui/assets/sofa_icon_macos.png`` so the app normally skips this step.
+    """
+    pil = pil.convert("RGBA")
+    size = max(pil.width, pil.height)
+    canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    inset = int(size * 0.08)
+    target = size - inset * 2
+    pil_resized = pil.resize((target, target), Image.LANCZOS)
+    radius = int(size * 0.18)
+    mask = Image.new("L", (target, target), 0)
+    drw = ImageDraw.Draw(mask)
+    drw.rounded_rectangle((0, 0, target, target), radius=radius, fill=255)
+    canvas.paste(pil_resized, (inset, inset), mask)
+    return canvas
+
+
+def _rounded_macos_icon(png_path: str, master: tk.Misc) -> Any:
+    return ImageTk.PhotoImage(_compose_macos_icon(Image.open(png_path)), master=master)
+
+
+def _apply_icon_now(window: tk.Misc) -> None:
+    """Resolve the icon files and apply them to *window* immediately."""
+
+    try:
+        if not int(window.winfo_exists()):
+            return
+    except Exception:
+        return
+    system = _SYSTEM
+    # macOS: use the pre-rendered rounded icon unless an override is set; no search needed
+    if system == "Darwin" and not any(_env_key()) and MACOS_ICON_PATH.is_file():
+        try:
+            mac_path = str(MACOS_ICON_PATH)
+            img = _cached_photo(window, mac_path, "png", lambda m: tk.PhotoImage(master=m, file=mac_path))
+            if hasattr(window, "iconphoto"):
+                window.iconphoto(True, img)  # type: ignore[misc]
+                setattr(window, "_iconphoto_ref", img)
+                return
+        except Exception:
+            pass
     png_path, ico_path = _iter_candidate_paths()
-    system = platform.system()
 
     # Try best option per platform
     try:
@@ -190,7 +379,7 @@ def set_app_icon(window: tk.Misc) -> None:
             # If a PNG is available, also set iconphoto for Tk widgets
             if png_path:
                 try:
-                    img = tk.PhotoImage(file=png_path)
+                    img = _cached_photo(window, png_path, "png", lambda m: tk.PhotoImage(master=m, file=png_path))
                     if hasattr(window, "iconphoto"):
                         window.iconphoto(True, img)  # type: ignore[misc]
                         setattr(window, "_iconphoto_ref", img)
@@ -202,18 +391,7 @@ def set_app_icon(window: tk.Misc) -> None:
                 # On macOS, shrink content and round corners to match system look
                 if system == "Darwin" and Image is not None and ImageTk is not None:
                     try:
-                        pil = Image.open(png_path).convert("RGBA")
-                        size = max(pil.width, pil.height)
-                        canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-                        inset = int(size * 0.08)
-                        target = size - inset * 2
-                        pil_resized = pil.resize((target, target), Image.LANCZOS)
-                        radius = int(size * 0.18)
-                        mask = Image.new("L", (target, target), 0)
-                        drw = ImageDraw.Draw(mask)
-                        drw.rounded_rectangle((0, 0, target, target), radius=radius, fill=255)
-                        canvas.paste(pil_resized, (inset, inset), mask)
-                        bio_img = ImageTk.PhotoImage(canvas)
+                        bio_img = _cached_photo(window, png_path, "macos-rounded", lambda m: _rounded_macos_icon(png_path, m))
                         if hasattr(window, "iconphoto"):
                             window.iconphoto(True, bio_img)  # type: ignore[misc]
                             setattr(window, "_iconphoto_ref", bio_img)
@@ -222,7 +400,7 @@ def set_app_icon(window: tk.Misc) -> None:
                         pass
                 # Generic PNG path
                 try:
-                    img = tk.PhotoImage(file=png_path)
+                    img = _cached_photo(window, png_path, "png", lambda m: tk.PhotoImage(master=m, file=png_path))
                     if hasattr(window, "iconphoto"):
                         window.iconphoto(True, img)  # type: ignore[misc]
                         setattr(window, "_iconphoto_ref", img)
@@ -232,8 +410,7 @@ def set_app_icon(window: tk.Misc) -> None:
             # If only ICO exists and Pillow is available, convert in-memory
             if ico_path and Image is not None and ImageTk is not None:
                 try:
-                    im = Image.open(ico_path)
-                    photo = ImageTk.PhotoImage(im)
+                    photo = _cached_photo(window, ico_path, "ico", lambda m: ImageTk.PhotoImage(Image.open(ico_path), master=m))
                     if hasattr(window, "iconphoto"):
                         window.iconphoto(True, photo)  # type: ignore[misc]
                         setattr(window, "_iconphoto_ref", photo)
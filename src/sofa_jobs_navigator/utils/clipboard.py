@@ -1,7 +1,10 @@
-"""Clipboard reader with pyperclip fallback."""
+"""Clipboard reader with native and pyperclip fallbacks."""
 
 from __future__ import annotations
 
+import sys
+from typing import Callable, Optional
+
 try:
     import pyperclip  # type: ignore
 except Exception:  # pragma: no cover
@@ -10,6 +13,72 @@ except Exception:  # pragma: no cover
 from ..config.flags import FlagSet, FLAGS
 
 
+# =================== NATIVE CLIPBOARD ===================
+# pyperclip shells out to pbpaste/xclip on every read. Where the OS exposes
+# the clipboard in-process (AppKit on macOS, user32 on Windows) read it directly.
+# --------------------------------------------------------
+
+_UNRESOLVED = object()
+_NATIVE_PASTE: object = _UNRESOLVED
+
+
+def _build_mac_paste() -> Callable[[], Optional[str]]:
+    from AppKit import NSPasteboard, NSPasteboardTypeString  # type: ignore
+
+    def paste() -> Optional[str]:
+        return NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString)
+
+    return paste
+
+
+def _build_windows_paste() -> Callable[[], Optional[str]]:
+    import ctypes
+    from ctypes import wintypes
+
+    cf_unicodetext = 13
+    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+
+    def paste() -> Optional[str]:
+        if not user32.OpenClipboard(None):
+            return None
+        try:
+            handle = user32.GetClipboardData(cf_unicodetext)
+            if not handle:
+                return None
+            ptr = kernel32.GlobalLock(handle)
+            if not ptr:
+                return None
+            try:
+                return ctypes.wstring_at(ptr)
+            finally:
+                kernel32.GlobalUnlock(handle)
+        finally:
+            user32.CloseClipboard()
+
+    return paste
+
+
+def _native_paste() -> Optional[Callable[[], Optional[str]]]:
+    """Return the in-process clipboard reader for this OS, or ``None``; resolved once."""
+    global _NATIVE_PASTE
+    if _NATIVE_PASTE is _UNRESOLVED:
+        try:
+            if sys.platform == 'darwin':
+                _NATIVE_PASTE = _build_mac_paste()
+            elif sys.platform == 'win32':
+                _NATIVE_PASTE = _build_windows_paste()
+            else:
+                _NATIVE_PASTE = None
+        except Exception:
+            _NATIVE_PASTE = None
+    return _NATIVE_PASTE  # type: ignore[return-value]
+
+
 class ClipboardReader:
     def __init__(self, *, flags: FlagSet = FLAGS, tk_root=None) -> None:
         self._flags = flags
@@ -27,6 +96,15 @@ class ClipboardReader:
             except Exception:
                 pass
 
+        native = _native_paste()
+        if native is not None:
+            try:
+                pasted = native()
+                if pasted:
+                    return pasted
+            except Exception:
+                pass
+
         if pyperclip is not None:
             try:
                 pasted = pyperclip.paste()
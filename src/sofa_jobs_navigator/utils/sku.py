@@ -7,7 +7,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    # Optional: RE2 matches in guaranteed linear time (no backtracking)
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None
 
 from ..config.flags import FLAGS
 
@@ -17,16 +23,40 @@ from ..config.flags import FLAGS
 #   - LEGACY_SOFA_20230101_1234
 #   - MOVIE_2023_TT1234567_M
 #   - SHOW_NAME_2024_TT12345678_S001_E010
-# Adjust ``SKU_PATTERNS`` if new formats appear.
+# SKUs are pure ASCII, so patterns use ``re.ASCII`` (``\d`` is just 0-9).
+# Adjust ``SKU_PATTERNS`` if new formats appear (and the literal prefilter in
+# ``SKUDetector._iter_matches`` if a new format lacks "_SOFA_"/"_TT").
 # -----------------------------------------------------------
 SKU_PATTERNS: List[re.Pattern[str]] = [
-    re.compile(r"[A-Z0-9_]+_SOFA_\d{8}_\d{4}"),
-    re.compile(r"[A-Z0-9]+_\d{4}_TT\d{7,8}_M"),
-    re.compile(r"[A-Z0-9_]+_\d{4}_TT\d{7,8}_S\d{3}_E\d{3}"),
+    re.compile(r"[A-Z0-9_]+_SOFA_\d{8}_\d{4}", re.ASCII),
+    re.compile(r"[A-Z0-9]+_\d{4}_TT\d{7,8}_M", re.ASCII),
+    re.compile(r"[A-Z0-9_]+_\d{4}_TT\d{7,8}_S\d{3}_E\d{3}", re.ASCII),
 ]
 
+# All patterns folded into one alternation so the text is scanned once. At any
+# given position the alternatives are tried in ``SKU_PATTERNS`` order.
+_COMBINED_SOURCE = "|".join(f"(?P<g{i}>{pattern.pattern})" for i, pattern in enumerate(SKU_PATTERNS))
+
+
+def _compile_combined():
+    """Compile the alternation with RE2 when installed, else with ``re``.
+
+    RE2 uses the same leftmost-first alternation semantics and its digit class is
+    ASCII-only, so both engines produce identical spans.
+    """
+
+    if re2 is not None:
+        try:
+            return re2.compile(_COMBINED_SOURCE)
+        except Exception:  # pragma: no cover - depends on the installed engine
+            pass
+    return re.compile(_COMBINED_SOURCE, re.ASCII)
+
+
+_COMBINED = _compile_combined()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SKUDetectionResult:
     """Container for a detected SKU instance."""
 
@@ -61,41 +91,67 @@ class SKUDetector:
     # Toggle ``FLAGS.verbose_logging`` to see detailed matching info.
     # -------- END VALIDATION ---------
     def find_all(self, text: str) -> List[SKUDetectionResult]:
-        """Return every SKU found in *text*.
+        """Return every SKU found in *text*, in the order they appear.
 
         The first pattern match wins when SKUs overlap. Results preserve the
         original casing extracted from the text.
         """
 
-        if not text:
-            return []
-
         matches: List[SKUDetectionResult] = []
-        for pattern in SKU_PATTERNS:
-            for match in pattern.finditer(text):
-                sku = match.group(0)
-                result = SKUDetectionResult(
-                    sku=sku,
-                    start=match.start(),
-                    end=match.end(),
-                    context=text[max(match.start() - 16, 0): match.end() + 16],
-                )
-                matches.append(result)
-                self._debug(f"SKU match @[{result.start}:{result.end}] => {result.sku}")
+        for match in self._iter_matches(text):
+            result = self._to_result(text, match)
+            matches.append(result)
+            self._debug("SKU match @[%d:%d] => %s", result.start, result.end, result.sku)
         return matches
 
+    def find_all_skus(self, text: str) -> List[str]:
+        """Return just the SKU strings from *text*, skipping result objects and context slices."""
+
+        return [match.group(0) for match in self._iter_matches(text)]
+
     def find_first(self, text: str) -> Optional[SKUDetectionResult]:
         """Return the first SKU detected in *text*, or ``None`` when absent."""
 
-        for result in self.find_all(text):
-            return result
-        self._debug("No SKU found in input text")
-        return None
+        # Stop at the first match instead of scanning and materialising them all
+        match = next(self._iter_matches(text), None)
+        if match is None:
+            self._debug("No SKU found in input text")
+            return None
+        result = self._to_result(text, match)
+        self._debug("SKU match @[%d:%d] => %s", result.start, result.end, result.sku)
+        return result
 
     # =================== INTERNALS ===================
-    def _debug(self, message: str) -> None:
+    @staticmethod
+    def _to_result(text: str, match: re.Match[str]) -> SKUDetectionResult:
+        start, end = match.span()
+        return SKUDetectionResult(
+            sku=match.group(0),
+            start=start,
+            end=end,
+            context=text[max(start - 16, 0): end + 16],
+        )
+
+    @staticmethod
+    def _iter_matches(text: str) -> Iterator[re.Match[str]]:
+        if not text:
+            return iter(())
+        # Every pattern contains one of these literals; substring checks are far
+        # cheaper than any regex pass for the common SKU-free clipboard.
+        if "_SOFA_" not in text and "_TT" not in text:
+            return iter(())
+        return _COMBINED.finditer(text)
+
+    def _debug(self, message: str, *args) -> None:
+        """Emit *message* (``%``-formatted with *args*) when verbose logging is on.
+
+        Formatting is deferred until after the flag check so hot loops pay
+        nothing when logging is off.
+        """
         if not self._flags.verbose_logging:
             return
+        if args:
+            message = message % args
         if self._logger:
             self._logger(message)
         else:
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import os
 import platform
-import subprocess
-from typing import Optional
+from typing import Any, Optional
 
 from ..config.flags import FlagSet, FLAGS
 
+_SYSTEM = platform.system()
+
+_MAC_SOUNDS = {'success': 'Glass', 'warning': 'Funk'}
+_LINUX_SOUNDS = {'success': 'success.wav', 'warning': 'warning.wav'}
+
 
 class SoundPlayer:
     def __init__(self, *, flags: FlagSet = FLAGS) -> None:
         self._flags = flags
-        self._system = platform.system()
+        self._system = _SYSTEM
         self._enabled = True
+        # Sounds decoded once on first use; None means "use the subprocess fallback".
+        self._handles: dict[str, Any] = {}
 
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable sound playback at runtime."""
@@ -26,18 +32,44 @@ class SoundPlayer:
     def play_warning(self) -> None:
         self._play('warning')
 
+    def _handle(self, sound_type: str) -> Any:
+        """Return a preloaded sound (NSSound or simpleaudio.WaveObject), or None."""
+        if sound_type in self._handles:
+            return self._handles[sound_type]
+        handle = None
+        try:
+            if self._system == 'Darwin':
+                from AppKit import NSSound  # type: ignore
+                handle = NSSound.soundNamed_(_MAC_SOUNDS[sound_type])
+            elif self._system != 'Windows':
+                import simpleaudio  # type: ignore
+                path = os.path.expanduser(f'~/sounds/{_LINUX_SOUNDS[sound_type]}')
+                handle = simpleaudio.WaveObject.from_wave_file(path)
+        except Exception:
+            handle = None
+        self._handles[sound_type] = handle
+        return handle
+
     def _play(self, sound_type: str) -> None:
         if self._flags.mute_sounds or not self._enabled:
             return
         try:
+            handle = self._handle(sound_type)
+            if handle is not None:
+                if self._system == 'Darwin':
+                    handle.stop()  # NSSound refuses to restart while still playing
+                handle.play()
+                return
             if self._system == 'Darwin':
-                name = 'Glass' if sound_type == 'success' else 'Funk'
+                import subprocess  # deferred: muted and preloaded paths never need it
+                name = _MAC_SOUNDS[sound_type]
                 subprocess.run(['afplay', f'/System/Library/Sounds/{name}.aiff'], check=False)
             elif self._system == 'Windows':
                 import winsound  # type: ignore
                 winsound.MessageBeep(winsound.MB_ICONEXCLAMATION if sound_type == 'warning' else winsound.MB_ICONASTERISK)
             else:
-                sound = 'success.wav' if sound_type == 'success' else 'warning.wav'
+                import subprocess
+                sound = _LINUX_SOUNDS[sound_type]
                 subprocess.run(['paplay', os.path.expanduser(f'~/sounds/{sound}')], check=False)
         except Exception:
             pass
@@ -18,3 +18,15 @@ def test_data_dir():
     if test_dir.exists():
         shutil.rmtree(test_dir)
         test_dir.mkdir(exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def test_data_dir_ro():
+    """Session-wide empty directory for tests that only read (never write) in it.
+
+    Kept apart from ``test_data_dir`` so no other fixture's cleanup touches it.
+    """
+    test_dir = Path(__file__).parent / "test_data_ro"
+    test_dir.mkdir(exist_ok=True)
+    yield test_dir
+    shutil.rmtree(test_dir, ignore_errors=True)
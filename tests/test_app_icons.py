@@ -0,0 +1,95 @@
+"""Tests for icon path resolution."""
+
+import os
+
+import pytest
+
+from sofa_jobs_navigator.utils import app_icons
+
+
+@pytest.fixture(autouse=True)
+def isolated_icon_cache(test_data_dir, monkeypatch):
+    cache_file = test_data_dir / 'cache' / 'icon_paths.json'
+    monkeypatch.setattr(app_icons, '_icon_cache_file', lambda: cache_file)
+    app_icons._reset_icon_cache()
+    return cache_file
+
+
+def test_candidate_paths_are_memoized(test_data_dir, monkeypatch):
+    icon = test_data_dir / 'sofa_icon.png'
+    icon.write_bytes(b'')
+    monkeypatch.setenv('SJN_ICON', str(icon))
+    app_icons._reset_icon_cache()
+    assert app_icons._iter_candidate_paths() == (str(icon), None)
+
+    calls = []
+    monkeypatch.setattr(app_icons, '_scan_candidate_paths', lambda: calls.append(1) or (None, None))
+    assert app_icons._iter_candidate_paths() == (str(icon), None)
+    assert calls == []
+
+
+def test_env_change_invalidates_cache(test_data_dir, monkeypatch):
+    first = test_data_dir / 'a.png'
+    second = test_data_dir / 'b.png'
+    first.write_bytes(b'')
+    second.write_bytes(b'')
+    monkeypatch.setenv('SJN_ICON', str(first))
+    app_icons._reset_icon_cache()
+    assert app_icons._iter_candidate_paths()[0] == str(first)
+    monkeypatch.setenv('SJN_ICON', str(second))
+    assert app_icons._iter_candidate_paths()[0] == str(second)
+
+
+def test_persisted_paths_skip_scan_until_icon_changes(test_data_dir, monkeypatch, isolated_icon_cache):
+    icon = test_data_dir / 'sofa_icon.png'
+    icon.write_bytes(b'')
+    monkeypatch.setenv('SJN_ICON', str(icon))
+    assert app_icons._iter_candidate_paths() == (str(icon), None)
+    assert isolated_icon_cache.exists()
+
+    # A fresh process: memory cache empty, disk cache still valid
+    app_icons._reset_icon_cache()
+    calls = []
+    monkeypatch.setattr(app_icons, '_scan_candidate_paths', lambda: calls.append(1) or (None, None))
+    assert app_icons._iter_candidate_paths() == (str(icon), None)
+    assert calls == []
+
+    stat = icon.stat()
+    os.utime(icon, (stat.st_atime, stat.st_mtime + 10))
+    app_icons._reset_icon_cache()
+    assert app_icons._iter_candidate_paths() == (None, None)
+    assert calls == [1]
+
+
+def test_moved_install_invalidates_persisted_paths(test_data_dir, monkeypatch):
+    icon = test_data_dir / 'sofa_icon.png'
+    icon.write_bytes(b'')
+    monkeypatch.setenv('SJN_ICON', str(icon))
+    assert app_icons._iter_candidate_paths() == (str(icon), None)
+
+    # Same cache file, but read by a copy of the app installed elsewhere
+    app_icons._reset_icon_cache()
+    monkeypatch.setattr(app_icons, '_MODULE_DIR', test_data_dir / 'other_install')
+    calls = []
+    monkeypatch.setattr(app_icons, '_scan_candidate_paths', lambda: calls.append(1) or (None, None))
+    assert app_icons._iter_candidate_paths() == (None, None)
+    assert calls == [1]
+
+
+def test_photo_cache_is_per_root():
+    class FakeRoot:
+        def _root(self):
+            return self
+
+    first, second = FakeRoot(), FakeRoot()
+    built = []
+
+    def build(master):
+        built.append(master)
+        return object()
+
+    img = app_icons._cached_photo(first, 'icon.png', 'png', build)
+    assert app_icons._cached_photo(first, 'icon.png', 'png', build) is img
+    # A recreated root must not reuse an image bound to the previous interpreter
+    assert app_icons._cached_photo(second, 'icon.png', 'png', build) is not img
+    assert built == [first, second]
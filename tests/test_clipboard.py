@@ -1,19 +1,13 @@
 """Clipboard reader tests."""
 
+from dataclasses import replace
+
 from sofa_jobs_navigator.config.flags import FlagSet
 from sofa_jobs_navigator.utils.clipboard import ClipboardReader
 
 
 def make_flags(mock=None):
-    return FlagSet(
-        verbose_logging=False,
-        offline_mode=False,
-        config_dry_run=False,
-        ui_debug=False,
-        mute_sounds=False,
-        mock_clipboard=mock,
-        test_hotkey=None,
-    )
+    return replace(FlagSet.DEFAULT, mock_clipboard=mock)
 
 
 def test_mock_clipboard_overrides():
@@ -27,3 +21,12 @@ def test_tk_root_used_when_no_mock(monkeypatch):
             return 'FROM_TK'
     reader = ClipboardReader(flags=make_flags(), tk_root=Dummy())
     assert reader.read_text() == 'FROM_TK'
+
+
+def test_native_reader_used_before_pyperclip(monkeypatch):
+    from sofa_jobs_navigator.utils import clipboard
+
+    monkeypatch.setattr(clipboard, '_NATIVE_PASTE', lambda: 'FROM_OS')
+    monkeypatch.setattr(clipboard, 'pyperclip', None)
+    reader = ClipboardReader(flags=make_flags())
+    assert reader.read_text() == 'FROM_OS'
@@ -2,22 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from sofa_jobs_navigator.config.flags import FlagSet
 from sofa_jobs_navigator.services.drive_client import DriveClient, DriveLookupResult
 
 
 def make_flags(*, offline: bool, verbose: bool = False) -> FlagSet:
-    return FlagSet(
-        verbose_logging=verbose,
-        offline_mode=offline,
-        config_dry_run=False,
-        ui_debug=False,
-        mute_sounds=False,
-        mock_clipboard=None,
-        test_hotkey=None,
-    )
+    return replace(FlagSet.DEFAULT, verbose_logging=verbose, offline_mode=offline)
 
 
 def test_shared_drive_routing():
@@ -58,3 +50,22 @@ def test_online_uses_service():
     assert root.folder_id == stub.root_id
     target = client.resolve_relative_path("MOVIE_2023_TT1234567_M", "A/B")
     assert target.folder_id == stub.resolved
+
+
+def test_online_lookups_are_cached_until_factory_changes():
+    calls = []
+
+    class CountingService(StubService):
+        def resolve_relative_path(self, *, shared_drive_id: str, parent_id: str, segments):
+            calls.append(tuple(segments))
+            return self.resolved
+
+    client = DriveClient(flags=make_flags(offline=False), service_factory=CountingService)
+    first = client.resolve_relative_path("MOVIE_2023_TT1234567_M", "A/B")
+    again = client.resolve_relative_path("MOVIE_2023_TT1234567_M", "A//B/")
+    assert again == first
+    assert calls == [("A", "B")]
+
+    client.set_service_factory(CountingService)
+    client.resolve_relative_path("MOVIE_2023_TT1234567_M", "A/B")
+    assert calls == [("A", "B"), ("A", "B")]
@@ -1,38 +1,95 @@
-from sofa_jobs_navigator.logging.event_log import EventLogger
+import logging
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from sofa_jobs_navigator.logging.event_log import EventLogger, _BatchedRotatingFileHandler
 from sofa_jobs_navigator.config.flags import FlagSet
 
 
+def _only_file(directory) -> Path:
+    """Return the single entry in *directory*, failing if there are zero or several."""
+    with os.scandir(directory) as it:
+        first = next(it, None)
+        assert first is not None and next(it, None) is None
+        return Path(first.path)
+
+
 def test_debug_respects_flag(test_data_dir, monkeypatch):
-    flags = FlagSet(
-        verbose_logging=False,
-        offline_mode=False,
-        config_dry_run=False,
-        ui_debug=False,
-        mute_sounds=False,
-        mock_clipboard=None,
-        test_hotkey=None,
-    )
+    flags = FlagSet.DEFAULT
     logger = EventLogger(flags=flags, log_dir=test_data_dir)
     logger.debug("should not appear")
-    files = list(test_data_dir.iterdir())
-    assert len(files) == 1
-    assert files[0].read_text() == ""
+    logger.debug(lambda: pytest.fail("lazy debug message built while verbose logging is off"))
+    assert _only_file(test_data_dir).read_text() == ""
 
 
 def test_info_writes_log(test_data_dir):
-    flags = FlagSet(
-        verbose_logging=True,
-        offline_mode=False,
-        config_dry_run=False,
-        ui_debug=False,
-        mute_sounds=False,
-        mock_clipboard=None,
-        test_hotkey=None,
-    )
+    flags = replace(FlagSet.DEFAULT, verbose_logging=True)
     logger = EventLogger(flags=flags, log_dir=test_data_dir)
     logger.info("hello", foo="bar")
-    files = list(test_data_dir.iterdir())
-    assert len(files) == 1
-    contents = files[0].read_text()
+    contents = _only_file(test_data_dir).read_text()
     assert "hello" in contents
     assert "foo" in contents
+
+
+def _batched_logger(log_file, max_delay=3600):
+    # Default effectively disables the timed flush so assertions don't depend on runner speed
+    handler = _BatchedRotatingFileHandler(log_file, maxBytes=512_000, backupCount=3, max_delay=max_delay)
+    logger = logging.getLogger(f"sofa_jobs_event_test.{log_file.parent.name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_info_is_batched_until_flush(test_data_dir):
+    log_file = test_data_dir / "events.log"
+    logger, handler = _batched_logger(log_file)
+    try:
+        logger.info("first")
+        logger.info("second")
+        assert log_file.read_text() == ""
+        handler.flush()
+        contents = log_file.read_text()
+        assert "first" in contents and "second" in contents
+        logger.warning("careful")
+        assert "careful" in log_file.read_text()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_reset_discards_pending_records(test_data_dir):
+    log_file = test_data_dir / "events.log"
+    logger, handler = _batched_logger(log_file)
+    try:
+        logger.warning("written before reset")
+        logger.info("pending before reset")
+        handler.reset()
+        logger.info("after reset")
+        handler.flush()
+        contents = log_file.read_text()
+        assert "before reset" not in contents
+        assert "after reset" in contents
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_idle_tail_is_written_after_max_delay(test_data_dir):
+    log_file = test_data_dir / "events.log"
+    logger, handler = _batched_logger(log_file, max_delay=0.05)
+    try:
+        logger.info("first")
+        logger.info("second")
+        timer = handler._timer
+        assert timer is not None
+        # No further records arrive; the timer alone must write the tail
+        timer.join(timeout=5)
+        contents = log_file.read_text()
+        assert "first" in contents and "second" in contents
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
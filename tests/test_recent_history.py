@@ -24,3 +24,11 @@ def test_clear():
     history.clear()
     assert history.items() == []
     assert settings.recent_skus == []
+
+
+def test_oldest_dropped_beyond_limit():
+    settings = make_settings()
+    history = RecentSKUHistory(settings)
+    for i in range(12):
+        history.add(f'SKU{i}')
+    assert history.items() == [f'SKU{i}' for i in range(11, 1, -1)]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -11,19 +12,11 @@ from sofa_jobs_navigator.config.settings import Favorite, Settings, SettingsMana
 
 
 def make_flags(*, dry_run: bool) -> FlagSet:
-    return FlagSet(
-        verbose_logging=False,
-        offline_mode=False,
-        config_dry_run=dry_run,
-        ui_debug=False,
-        mute_sounds=False,
-        mock_clipboard=None,
-        test_hotkey=None,
-    )
+    return replace(FlagSet.DEFAULT, config_dry_run=dry_run)
 
 
-def test_defaults_loaded_when_missing(test_data_dir: Path):
-    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+def test_defaults_loaded_when_missing(test_data_dir_ro: Path):
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir_ro)
     settings = manager.load()
     # At least 8 favorites should be present by default
     assert len(settings.favorites) >= 8
@@ -56,3 +49,64 @@ def test_dry_run_skips_write(test_data_dir: Path):
     original = manager.load()
     manager.save(Settings(favorites=[], working_folder="/tmp", recent_skus=["SKU"]))
     assert not (test_data_dir / 'config.json').exists()
+
+
+def test_load_reuses_parsed_config_until_file_changes(test_data_dir: Path, monkeypatch):
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    manager.save(Settings(favorites=[], working_folder="/first", recent_skus=[]))
+
+    import sofa_jobs_navigator.config.settings as settings_module
+
+    def fail_load(data):
+        raise AssertionError("config.json should not be re-parsed")
+
+    monkeypatch.setattr(settings_module, '_loads', fail_load)
+    assert manager.load().working_folder == "/first"
+
+    monkeypatch.undo()
+    other = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    other.save(Settings(favorites=[], working_folder="/second-longer", recent_skus=[]))
+    assert manager.load().working_folder == "/second-longer"
+
+
+def test_save_replaces_file_without_leaving_temp(test_data_dir: Path):
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    manager.save(Settings(favorites=[], working_folder="/a", recent_skus=[]))
+    manager.save(Settings(favorites=[], working_folder="/b", recent_skus=[]), durable=True)
+    assert sorted(p.name for p in test_data_dir.iterdir()) == ['config.json']
+    manager.invalidate()
+    assert manager.load().working_folder == "/b"
+
+
+def test_unchanged_save_skips_write(test_data_dir: Path):
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    settings = Settings(favorites=[], working_folder="/a", recent_skus=["SKU1"])
+    manager.save(settings)
+    config = test_data_dir / 'config.json'
+    first_inode = config.stat().st_ino
+    manager.save(settings)
+    assert config.stat().st_ino == first_inode
+    settings.recent_skus.append("SKU2")
+    manager.save(settings)
+    assert config.stat().st_ino != first_inode
+
+
+def test_truncated_config_falls_back_to_defaults(test_data_dir: Path):
+    (test_data_dir / 'config.json').write_text('{"favorites": [', encoding='utf-8')
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    settings = manager.load()
+    assert len(settings.favorites) >= 8
+    assert settings.recent_skus == []
+
+
+def test_unreadable_config_is_kept_before_defaults_are_saved(test_data_dir: Path):
+    original = b'{"favorites": [], "working_folder": "/work",}'
+    (test_data_dir / 'config.json').write_bytes(original)
+    manager = SettingsManager(flags=make_flags(dry_run=False), config_dir=test_data_dir)
+    settings = manager.load()
+    settings.session_count += 1
+    manager.save(settings)
+
+    kept = list(test_data_dir.glob('config.json.corrupt-*'))
+    assert len(kept) == 1
+    assert kept[0].read_bytes() == original
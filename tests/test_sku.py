@@ -21,3 +21,24 @@ def test_find_first(sample, expected):
 
 def test_no_match_returns_none():
     assert DEFAULT_DETECTOR.find_first("no sku here") is None
+
+
+def test_find_all_returns_matches_in_text_order():
+    text = "SHOW_NAME_2024_TT12345678_S001_E010 then MOVIE_2023_TT1234567_M and LEGACY_SOFA_20230101_1234"
+    skus = [result.sku for result in DEFAULT_DETECTOR.find_all(text)]
+    assert skus == [
+        "SHOW_NAME_2024_TT12345678_S001_E010",
+        "MOVIE_2023_TT1234567_M",
+        "LEGACY_SOFA_20230101_1234",
+    ]
+
+
+def test_find_all_skus_matches_find_all():
+    text = "MOVIE_2023_TT1234567_M and LEGACY_SOFA_20230101_1234"
+    assert DEFAULT_DETECTOR.find_all_skus(text) == [r.sku for r in DEFAULT_DETECTOR.find_all(text)]
+    assert DEFAULT_DETECTOR.find_all_skus("nothing to see") == []
+
+
+def test_non_ascii_digits_are_not_sku_digits():
+    # Arabic-Indic digits satisfy a Unicode \d but never appear in real SKUs
+    assert DEFAULT_DETECTOR.find_first("MOVIE_2023_TT١٢٣٤٥٦٧_M") is None
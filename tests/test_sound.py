@@ -1,5 +1,6 @@
 """Sound player tests."""
 
+from dataclasses import replace
 from unittest import mock
 
 from sofa_jobs_navigator.config.flags import FlagSet
@@ -7,15 +8,7 @@ from sofa_jobs_navigator.utils.sound import SoundPlayer
 
 
 def make_flags(*, mute=False):
-    return FlagSet(
-        verbose_logging=False,
-        offline_mode=False,
-        config_dry_run=False,
-        ui_debug=False,
-        mute_sounds=mute,
-        mock_clipboard=None,
-        test_hotkey=None,
-    )
+    return replace(FlagSet.DEFAULT, mute_sounds=mute)
 
 
 def test_mute_skips_subprocess(monkeypatch):
@@ -28,6 +21,18 @@ def test_mute_skips_subprocess(monkeypatch):
 def test_play_success_invokes_subprocess(monkeypatch):
     player = SoundPlayer(flags=make_flags())
     monkeypatch.setattr(player, '_system', 'Darwin')
+    # No native handle, so the afplay fallback runs even where AppKit is installed
+    monkeypatch.setattr(player, '_handle', lambda *_: None)
     with mock.patch('subprocess.run') as run_mock:
         player.play_success()
         assert run_mock.called
+
+
+def test_preloaded_sound_skips_subprocess(monkeypatch):
+    player = SoundPlayer(flags=make_flags())
+    handle = mock.Mock()
+    player._handles['success'] = handle
+    with mock.patch('subprocess.run') as run_mock:
+        player.play_success()
+        run_mock.assert_not_called()
+    handle.play.assert_called_once()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Pre-render the rounded macOS window icon.
+
+Usage:
+  python tools/render_mac_icon.py                # writes the default output
+  python tools/render_mac_icon.py --src other.png
+
+Produces `src/sofa_jobs_navigator/ui/assets/sofa_icon_macos.png` from the
+project `sofa_icon.png` so the app can load it directly on macOS instead of
+compositing the inset/rounded variant with Pillow at every start.
+Requires Pillow; re-run whenever `sofa_icon.png` changes.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SOURCE_ICON = ROOT / "sofa_icon.png"
+sys.path.insert(0, str(ROOT / "src"))
+
+from sofa_jobs_navigator.utils.app_icons import MACOS_ICON_PATH, _compose_macos_icon  # noqa: E402
+
+
+def render(src: pathlib.Path, dest: pathlib.Path) -> None:
+    from PIL import Image
+
+    with Image.open(src) as im:
+        rounded = _compose_macos_icon(im)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    rounded.save(dest, format="PNG", optimize=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Render the rounded macOS app icon")
+    ap.add_argument("--src", type=pathlib.Path, default=SOURCE_ICON, help="source PNG (default: sofa_icon.png)")
+    ap.add_argument("--out", type=pathlib.Path, default=MACOS_ICON_PATH, help="output PNG")
+    args = ap.parse_args(argv)
+
+    render(args.src, args.out)
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
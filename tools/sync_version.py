@@ -20,11 +20,34 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 PACKAGE_VERSION_PY = ROOT / "src" / "sofa_jobs_navigator" / "version.py"
 PYPROJECT = ROOT / "pyproject.toml"
 
+# Accept optional type annotations like: VERSION: str = "1.3.7"
+VERSION_RE = re.compile(r"^VERSION(?:\s*:\s*[^=]+)?\s*=\s*[\"']([^\"']+)[\"']", flags=re.M)
+PYPROJECT_VERSION_RE = re.compile(r'^(version\s*=\s*)["\'][^"\']+["\']', flags=re.M)
+
+
+def _scan_version_line(text: str) -> str | None:
+    """Plain string scan for the usual `VERSION[: str] = "x.y.z"` line."""
+    for line in text.splitlines():
+        if not line.startswith("VERSION"):
+            continue
+        head, sep, value = line.partition("=")
+        if not sep or head[len("VERSION"):].strip()[:1] not in ("", ":"):
+            continue  # e.g. VERSION_INFO = ...
+        value = value.strip()
+        quote = value[:1]
+        if quote in ("'", '"'):
+            end = value.find(quote, 1)
+            if end > 1:
+                return value[1:end]
+    return None
+
 
 def discover_version(path: pathlib.Path) -> str:
     text = path.read_text(encoding="utf8")
-    # Accept optional type annotations like: VERSION: str = "1.3.7"
-    m = re.search(r"^VERSION(?:\s*:\s*[^=]+)?\s*=\s*[\"']([^\"']+)[\"']", text, flags=re.M)
+    version = _scan_version_line(text)
+    if version is not None:
+        return version
+    m = VERSION_RE.search(text)
     if not m:
         raise SystemExit(f"Couldn't find VERSION in {path}")
     return m.group(1)
@@ -33,11 +56,7 @@ def discover_version(path: pathlib.Path) -> str:
 def update_pyproject(pyproject: pathlib.Path, version: str) -> bool:
     text = pyproject.read_text(encoding="utf8")
     # replace the first top-level 'version = "..."' occurrence
-    new_text, n = re.subn(r'^(version\s*=\s*)["\'][^"\']+["\']',
-                         lambda m: f'{m.group(1)}"{version}"',
-                         text,
-                         count=1,
-                         flags=re.M)
+    new_text, n = PYPROJECT_VERSION_RE.subn(lambda m: f'{m.group(1)}"{version}"', text, count=1)
     if n == 0:
         raise SystemExit(f"No 'version = ...' line found in {pyproject}")
     if new_text == text: